@@ -15,7 +15,6 @@ License: MIT
 
 import sys
 import argparse
-import logging
 import time
 from pathlib import Path
 from typing import List
@@ -56,7 +55,7 @@ try:
         WhisperTranscriber, 
         PlatformUtils
     )
-    from mp4_to_text import MP4ToTextProcessor
+    from mp4_to_text import MP4ToTextProcessor, setup_logging
 except ImportError as e:
     print(f"Error: Failed to import core modules: {e}")
     print("Please ensure all dependencies are installed and core modules are available.")
@@ -232,8 +231,9 @@ def main():
             config_manager.processing_config.quiet = True
         
         # 设置日志
-        if not args.quiet:
-            logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+        if args.verbose:
+            config_manager.logging_config.level = 'DEBUG'
+        setup_logging(config_manager)
         
         # 创建并运行处理器
         move_to_done = not args.no_move
@@ -297,7 +297,7 @@ def main():
         # 清理工作
         try:
             if 'processor' in locals():
-                processor.transcriber.unload_model()
+                processor.release_model()
         except Exception:
             pass
 
@@ -5,10 +5,11 @@ Handles cross-platform audio extraction using FFmpeg with progress monitoring.
 
 import os
 import subprocess
+import threading
 import time
 import re
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any, Tuple
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 try:
@@ -17,6 +18,15 @@ try:
 except ImportError:
     FFMPEG_PYTHON_AVAILABLE = False
 
+import numpy as np
+
+# Whisper consumes 16 kHz mono; stream_pcm always decodes to this rate
+PCM_SAMPLE_RATE = 16000
+
+# Audio codecs that can be remuxed into Matroska as-is instead of re-encoded.
+# Only PCM can already be at Whisper's 16 kHz: Opus always decodes at 48 kHz.
+STREAM_COPY_CODECS = frozenset({'pcm_s16le'})
+
 from .platform_utils import PlatformUtils
 
 
@@ -211,7 +221,8 @@ class AudioProcessor:
             return {'duration': 0, 'has_audio': False, 'has_video': False, 'size_bytes': 0}
     
     def extract_audio(self, video_path: Path, output_path: Optional[Path] = None, 
-                     progress_callback: Optional[Callable[[float], None]] = None) -> Path:
+                     progress_callback: Optional[Callable[[float], None]] = None,
+                     mode: str = 'transcode') -> Path:
         """
         Extract audio from video file with progress monitoring.
         
@@ -219,18 +230,20 @@ class AudioProcessor:
             video_path: Path to input video file
             output_path: Path for output audio file (optional)
             progress_callback: Callback function for progress updates (0.0 to 1.0)
+            mode: 'transcode' (default) to re-encode to the configured format,
+                'copy' to remux the audio track unchanged into Matroska, or
+                'auto' to copy when the track already matches the configured
+                rate and channels (only when output_path is not given). Copy
+                modes return a .mka file instead of the configured format
             
         Returns:
             Path to extracted audio file
         """
+        if mode not in ('auto', 'copy', 'transcode'):
+            raise ValueError(f"Invalid extraction mode: {mode}")
         if not video_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
-        # Generate output path if not provided
-        if output_path is None:
-            audio_filename = f"{video_path.stem}.{self.config['output_format']}"
-            output_path = self.temp_dir / audio_filename
-        
         # Get video info for progress calculation
         video_info = self.get_video_info(video_path)
         total_duration = video_info.get('duration', 0)
@@ -238,6 +251,20 @@ class AudioProcessor:
         if not video_info.get('has_audio', False):
             raise ValueError(f"No audio stream found in video: {video_path}")
         
+        if mode == 'auto':
+            mode = 'copy' if output_path is None and self._can_stream_copy(video_info) else 'transcode'
+        
+        # Generate output path if not provided
+        if output_path is None:
+            extension = 'mka' if mode == 'copy' else self.config['output_format']
+            output_path = self.temp_dir / f"{video_path.stem}.{extension}"
+        
+        # Stream copy only demuxes, so it never needs the ffmpeg-python graph
+        if mode == 'copy':
+            return self._extract_audio_subprocess(
+                video_path, output_path, total_duration, progress_callback, copy=True
+            )
+        
         # Use appropriate extraction method
         if FFMPEG_PYTHON_AVAILABLE:
             return self._extract_audio_ffmpeg_python(
@@ -248,6 +275,124 @@ class AudioProcessor:
                 video_path, output_path, total_duration, progress_callback
             )
     
+    def _can_stream_copy(self, video_info: Dict[str, Any]) -> bool:
+        """Check whether the audio track can be kept as-is for extraction."""
+        if self.config.get('normalize_audio', False) or self.config.get('remove_silence', False):
+            return False
+        return (video_info.get('audio_codec') in STREAM_COPY_CODECS
+                and video_info.get('audio_sample_rate') == self.config['sample_rate']
+                and video_info.get('audio_channels') == self.config['channels'])
+    
+    def stream_pcm(self, video_path: Path, duration: float = 0.0) -> 'np.ndarray':
+        """
+        Decode a video's audio track straight into memory, without a temp file.
+        
+        FFmpeg writes raw float32 PCM to a pipe, which is read directly into a
+        buffer sized from the expected duration. The whole track is held in
+        memory: 16 kHz float32 is about 230 MB per hour of audio.
+        
+        Args:
+            video_path: Path to input video file
+            duration: Expected duration in seconds (0 if unknown)
+            
+        Returns:
+            16 kHz mono float32 samples
+        """
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        
+        cmd = [
+            self.ffmpeg_path,
+            '-nostdin',
+            '-v', 'error',
+            '-i', str(video_path),
+            '-vn',
+            '-f', 'f32le',
+            '-ac', '1',
+            '-ar', str(PCM_SAMPLE_RATE)
+        ]
+        
+        filters = []
+        if self.config.get('normalize_audio', False):
+            filters.append('loudnorm')
+        if self.config.get('remove_silence', False):
+            filters.append('silenceremove=start_periods=1:start_duration=0.1:start_threshold=-50dB')
+        if filters:
+            cmd += ['-af', ','.join(filters)]
+        cmd.append('-')
+        
+        # One second of slack covers container/stream duration mismatches
+        samples = np.empty(max(int((duration + 1.0) * PCM_SAMPLE_RATE), PCM_SAMPLE_RATE),
+                           dtype=np.float32)
+        filled = 0
+        
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        
+        # Drain stderr alongside stdout: if FFmpeg fills the stderr pipe with
+        # warnings while we block on stdout, both sides would wait forever
+        stderr_chunks = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+        )
+        stderr_reader.start()
+        try:
+            buffer = memoryview(samples).cast('B')
+            while True:
+                if filled == len(buffer):
+                    grown = np.empty(len(samples) * 2, dtype=np.float32)
+                    grown[:len(samples)] = samples
+                    samples = grown
+                    buffer = memoryview(samples).cast('B')
+                
+                read = process.stdout.readinto(buffer[filled:])
+                if not read:
+                    break
+                filled += read
+            
+            process.wait()
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            stderr_reader.join()
+            process.stdout.close()
+            process.stderr.close()
+        
+        if process.returncode != 0:
+            stderr = b''.join(stderr_chunks).decode('utf-8', 'replace').strip()
+            raise RuntimeError(f"Audio decoding failed: {stderr}")
+        if filled == 0:
+            raise RuntimeError("Audio decoding failed: no samples produced")
+        
+        return samples[:filled // samples.itemsize]
+    
+    @staticmethod
+    def split_chunks(samples: 'np.ndarray', chunk_len: float = 30.0,
+                     overlap: float = 1.0) -> Tuple[List['np.ndarray'], List[float]]:
+        """
+        Split decoded audio into fixed-length chunks that overlap slightly.
+        
+        The overlap keeps words cut at a boundary intact in at least one
+        chunk. Chunks are views into samples, so no audio is copied.
+        
+        Args:
+            samples: 16 kHz mono samples from stream_pcm()
+            chunk_len: Chunk length in seconds
+            overlap: Seconds shared by neighbouring chunks
+            
+        Returns:
+            Tuple of (chunks, chunk start times in seconds)
+        """
+        chunk_size = int(chunk_len * PCM_SAMPLE_RATE)
+        overlap_size = int(overlap * PCM_SAMPLE_RATE)
+        step = chunk_size - overlap_size
+        
+        # Stop before a final chunk that would only repeat the overlap
+        starts = range(0, max(len(samples) - overlap_size, 1), step)
+        chunks = [samples[start:start + chunk_size] for start in starts]
+        offsets = [start / PCM_SAMPLE_RATE for start in starts]
+        return chunks, offsets
+    
     def _extract_audio_ffmpeg_python(self, video_path: Path, output_path: Path,
                                    total_duration: float, 
                                    progress_callback: Optional[Callable[[float], None]]) -> Path:
@@ -296,17 +441,25 @@ class AudioProcessor:
     
     def _extract_audio_subprocess(self, video_path: Path, output_path: Path,
                                 total_duration: float,
-                                progress_callback: Optional[Callable[[float], None]]) -> Path:
-        """Extract audio using subprocess."""
+                                progress_callback: Optional[Callable[[float], None]],
+                                copy: bool = False) -> Path:
+        """Extract audio using subprocess, optionally copying the stream without re-encoding."""
         try:
+            if copy:
+                codec_args = ['-c:a', 'copy']
+            else:
+                codec_args = [
+                    '-acodec', 'pcm_s16le',
+                    '-ar', str(self.config['sample_rate']),
+                    '-ac', str(self.config['channels'])
+                ]
+            
             # Build FFmpeg command
             cmd = [
                 self.ffmpeg_path,
                 '-i', str(video_path),
                 '-vn',  # No video
-                '-acodec', 'pcm_s16le',
-                '-ar', str(self.config['sample_rate']),
-                '-ac', str(self.config['channels']),
+                *codec_args,
                 '-y',   # Overwrite output
                 str(output_path)
             ]
@@ -19,9 +19,16 @@ class ProcessingConfig:
     input_dir: str = ""
     output_dir: str = ""
     model_name: str = "medium"
+    backend: str = "openai"
     language: str = "auto"
     device: str = "auto"
     max_workers: int = 1
+    batch_size: int = 1
+    chunk_threshold: float = 0.0
+    dtype: str = "fp16"
+    attn_impl: str = "auto"
+    quantize: str = "int8"
+    model_cache: bool = False
     skip_existing: bool = False
     cleanup_temp: bool = True
     verbose: bool = False
@@ -203,7 +210,14 @@ class ConfigManager:
                 section = self.config['PROCESSING']
                 self.processing_config.model_name = section.get('model_name', self.processing_config.model_name)
                 self.processing_config.language = section.get('language', self.processing_config.language)
+                self.processing_config.backend = section.get('backend', self.processing_config.backend)
                 self.processing_config.max_workers = section.getint('max_workers', self.processing_config.max_workers)
+                self.processing_config.batch_size = section.getint('batch_size', self.processing_config.batch_size)
+                self.processing_config.chunk_threshold = section.getfloat('chunk_threshold', self.processing_config.chunk_threshold)
+                self.processing_config.dtype = section.get('dtype', self.processing_config.dtype)
+                self.processing_config.attn_impl = section.get('attn_impl', self.processing_config.attn_impl)
+                self.processing_config.quantize = section.get('quantize', self.processing_config.quantize)
+                self.processing_config.model_cache = section.getboolean('model_cache', self.processing_config.model_cache)
                 self.processing_config.skip_existing = section.getboolean('skip_existing', self.processing_config.skip_existing)
                 self.processing_config.cleanup_temp = section.getboolean('cleanup_temp', self.processing_config.cleanup_temp)
                 
@@ -251,6 +265,9 @@ class ConfigManager:
             else:
                 raise ValueError(f"Unsupported model: {args.model}. Supported models: {list(self.WHISPER_MODELS.keys())}")
                 
+        if hasattr(args, 'backend') and args.backend:
+            self.processing_config.backend = args.backend
+            
         if hasattr(args, 'language') and args.language:
             if args.language in self.SUPPORTED_LANGUAGES:
                 self.processing_config.language = args.language
@@ -263,6 +280,15 @@ class ConfigManager:
         if hasattr(args, 'workers') and args.workers:
             self.processing_config.max_workers = args.workers
             
+        if hasattr(args, 'batch_size') and args.batch_size:
+            self.processing_config.batch_size = args.batch_size
+            
+        if hasattr(args, 'quantize') and args.quantize:
+            self.processing_config.quantize = args.quantize
+            
+        if hasattr(args, 'model_cache') and args.model_cache:
+            self.processing_config.model_cache = args.model_cache
+            
         if hasattr(args, 'skip_existing') and args.skip_existing:
             self.processing_config.skip_existing = args.skip_existing
             
@@ -300,6 +326,18 @@ class ConfigManager:
         if self.processing_config.model_name not in self.WHISPER_MODELS:
             errors.append(f"Invalid model: {self.processing_config.model_name}")
             
+        # Validate backend
+        if self.processing_config.backend not in ('openai', 'faster', 'transformers'):
+            errors.append(f"Invalid backend: {self.processing_config.backend}")
+            
+        # Validate precision and attention settings
+        if self.processing_config.dtype not in ('fp16', 'fp32'):
+            errors.append(f"Invalid dtype: {self.processing_config.dtype} (expected fp16 or fp32)")
+        if self.processing_config.attn_impl not in ('auto', 'sdpa', 'flash_attention_2', 'eager'):
+            errors.append(f"Invalid attention implementation: {self.processing_config.attn_impl}")
+        if self.processing_config.quantize not in ('none', 'int8', 'int4'):
+            errors.append(f"Invalid quantization: {self.processing_config.quantize} (expected none, int8 or int4)")
+            
         # Validate device
         available_device, _ = self.platform_utils.detect_device()
         if self.processing_config.device not in ['auto', 'cpu', 'cuda', 'mps', available_device]:
@@ -335,8 +373,15 @@ class ConfigManager:
         config.add_section('PROCESSING')
         config.set('PROCESSING', 'model_name', self.processing_config.model_name)
         config.set('PROCESSING', 'language', self.processing_config.language)
+        config.set('PROCESSING', 'backend', self.processing_config.backend)
         config.set('PROCESSING', 'device', self.processing_config.device)
         config.set('PROCESSING', 'max_workers', str(self.processing_config.max_workers))
+        config.set('PROCESSING', 'batch_size', str(self.processing_config.batch_size))
+        config.set('PROCESSING', 'chunk_threshold', str(self.processing_config.chunk_threshold))
+        config.set('PROCESSING', 'dtype', self.processing_config.dtype)
+        config.set('PROCESSING', 'attn_impl', self.processing_config.attn_impl)
+        config.set('PROCESSING', 'quantize', self.processing_config.quantize)
+        config.set('PROCESSING', 'model_cache', str(self.processing_config.model_cache))
         config.set('PROCESSING', 'skip_existing', str(self.processing_config.skip_existing))
         config.set('PROCESSING', 'cleanup_temp', str(self.processing_config.cleanup_temp))
         
@@ -383,6 +428,7 @@ class ConfigManager:
         """Print a summary of current configuration."""
         print("=== Configuration Summary ===")
         print(f"Model: {self.processing_config.model_name}")
+        print(f"Backend: {self.processing_config.backend}")
         print(f"Device: {self.get_effective_device()}")
         print(f"Language: {self.processing_config.language}")
         print(f"Max Workers: {self.processing_config.max_workers}")
@@ -170,13 +170,37 @@ class FileManager:
         
         return hash_md5.hexdigest()
     
-    def is_processed(self, video_path: Path, skip_existing: bool = True) -> bool:
+    def build_processed_index(self) -> Set[str]:
+        """
+        Collect every transcript under the output directory in one scan.
+        
+        Returns:
+            Set of output file paths (as strings) that exist and are not empty
+        """
+        index = set()
+        pending = [str(self.output_dir)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith('.txt') and entry.stat().st_size > 0:
+                            index.add(entry.path)
+            except OSError:
+                continue
+        return index
+    
+    def is_processed(self, video_path: Path, skip_existing: bool = True,
+                     processed_index: Optional[Set[str]] = None) -> bool:
         """
         Check if a video file has already been processed.
         
         Args:
             video_path: Path to the video file
             skip_existing: Whether to skip existing output files
+            processed_index: Result of build_processed_index(); when given,
+                output files are looked up in it instead of on disk
             
         Returns:
             True if file should be skipped, False otherwise
@@ -186,7 +210,10 @@ class FileManager:
             
         # Check if output file exists
         output_path = self.get_output_path(video_path)
-        if not output_path.exists():
+        if processed_index is not None:
+            if str(output_path) not in processed_index:
+                return False
+        elif not output_path.exists():
             return False
             
         # Check processing history
@@ -196,6 +223,9 @@ class FileManager:
             
             # Check if file was successfully processed
             if file_info.get('success', False):
+                # The index only holds non-empty files
+                if processed_index is not None:
+                    return True
                 # Check if output file still exists and is not empty
                 if output_path.exists() and output_path.stat().st_size > 0:
                     return True
@@ -3,6 +3,8 @@ Platform utilities for cross-platform support and device detection.
 Handles Windows, macOS, and Linux compatibility, plus GPU/CPU detection.
 """
 
+import functools
+import importlib.util
 import os
 import platform
 import subprocess
@@ -10,11 +12,8 @@ import sys
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
+# torch is imported lazily in detect_device(); importing it takes seconds
+TORCH_AVAILABLE = importlib.util.find_spec('torch') is not None
 
 try:
     import colorama
@@ -24,6 +23,74 @@ except ImportError:
     COLORAMA_AVAILABLE = False
 
 
+# Device and FFmpeg detection depend only on the environment, so probe once
+# per process; torch import and the ffmpeg fork+exec are the expensive parts.
+@functools.lru_cache(maxsize=None)
+def _detect_device() -> Tuple[str, Dict[str, any]]:
+    """Probe torch for the best device; cached, see PlatformUtils.detect_device."""
+    device_info = {
+        'torch_available': TORCH_AVAILABLE,
+        'cuda_available': False,
+        'mps_available': False,
+        'device_name': 'cpu',
+        'gpu_count': 0,
+        'gpu_memory': 0
+    }
+    
+    if not TORCH_AVAILABLE:
+        return 'cpu', device_info
+    
+    import torch
+        
+    # Check CUDA (NVIDIA GPU)
+    if torch.cuda.is_available():
+        device_info.update({
+            'cuda_available': True,
+            'device_name': 'cuda',
+            'gpu_count': torch.cuda.device_count(),
+            'gpu_memory': torch.cuda.get_device_properties(0).total_memory if torch.cuda.device_count() > 0 else 0
+        })
+        return 'cuda', device_info
+        
+    # Check MPS (Apple Silicon GPU)
+    if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+        device_info.update({
+            'mps_available': True,
+            'device_name': 'mps'
+        })
+        return 'mps', device_info
+        
+    return 'cpu', device_info
+
+
+@functools.lru_cache(maxsize=None)
+def _check_ffmpeg(is_windows: bool) -> Tuple[bool, Optional[str]]:
+    """Run ffmpeg -version once; cached, see PlatformUtils.check_ffmpeg."""
+    try:
+        if is_windows:
+            # Windows might have ffmpeg.exe
+            cmd = ['ffmpeg.exe', '-version']
+        else:
+            cmd = ['ffmpeg', '-version']
+            
+        result = subprocess.run(
+            cmd, 
+            capture_output=True, 
+            text=True, 
+            timeout=10
+        )
+        
+        if result.returncode == 0:
+            # Extract version from output
+            first_line = result.stdout.split('\n')[0]
+            return True, first_line
+        else:
+            return False, None
+            
+    except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
+        return False, None
+
+
 class PlatformUtils:
     """Cross-platform utilities for system detection and path handling."""
     
@@ -50,63 +117,13 @@ class PlatformUtils:
         Detect the best device for Whisper processing.
         Returns: (device_name, device_info)
         """
-        device_info = {
-            'torch_available': TORCH_AVAILABLE,
-            'cuda_available': False,
-            'mps_available': False,
-            'device_name': 'cpu',
-            'gpu_count': 0,
-            'gpu_memory': 0
-        }
-        
-        if not TORCH_AVAILABLE:
-            return 'cpu', device_info
-            
-        # Check CUDA (NVIDIA GPU)
-        if torch.cuda.is_available():
-            device_info.update({
-                'cuda_available': True,
-                'device_name': 'cuda',
-                'gpu_count': torch.cuda.device_count(),
-                'gpu_memory': torch.cuda.get_device_properties(0).total_memory if torch.cuda.device_count() > 0 else 0
-            })
-            return 'cuda', device_info
-            
-        # Check MPS (Apple Silicon GPU)
-        if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-            device_info.update({
-                'mps_available': True,
-                'device_name': 'mps'
-            })
-            return 'mps', device_info
-            
-        return 'cpu', device_info
+        device, device_info = _detect_device()
+        # Copy so callers can't mutate the cached result
+        return device, dict(device_info)
     
     def check_ffmpeg(self) -> Tuple[bool, Optional[str]]:
         """Check if FFmpeg is available and get version."""
-        try:
-            if self.is_windows:
-                # Windows might have ffmpeg.exe
-                cmd = ['ffmpeg.exe', '-version']
-            else:
-                cmd = ['ffmpeg', '-version']
-                
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                # Extract version from output
-                first_line = result.stdout.split('\n')[0]
-                return True, first_line
-            else:
-                return False, None
-                
-        except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
-            return False, None
+        return _check_ffmpeg(self.is_windows)
     
     def get_temp_dir(self) -> Path:
         """Get platform-appropriate temporary directory."""
@@ -3,45 +3,285 @@ Whisper transcriber for MP4ToText tool.
 Handles cross-platform OpenAI Whisper integration with GPU/CPU auto-detection.
 """
 
+import functools
+import gc
+import importlib.util
+import json
 import os
+import platform
+import statistics
+import sys
 import warnings
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable, List, Union
+from typing import Dict, Any, Optional, Callable, List, NamedTuple, Union
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
 
+import numpy as np
+
+# whisper, torch and torchaudio take seconds to import; they are loaded on first
+# use so that model listings and CLI help stay fast
+WHISPER_AVAILABLE = importlib.util.find_spec('whisper') is not None
+TORCH_AVAILABLE = importlib.util.find_spec('torch') is not None
+TORCHAUDIO_AVAILABLE = importlib.util.find_spec('torchaudio') is not None
+
+# Optional batched backend (transcribe_batch); flash_attn enables FlashAttention 2
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec('transformers') is not None
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec('faster_whisper') is not None
+FLASH_ATTN_AVAILABLE = importlib.util.find_spec('flash_attn') is not None
+BITSANDBYTES_AVAILABLE = importlib.util.find_spec('bitsandbytes') is not None
+
+whisper = None
+torch = None
+torchaudio = None
+
 try:
-    import whisper
-    WHISPER_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    WHISPER_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 try:
-    import torch
-    TORCH_AVAILABLE = True
+    import soundfile
+    SOUNDFILE_AVAILABLE = True
 except ImportError:
-    TORCH_AVAILABLE = False
+    SOUNDFILE_AVAILABLE = False
 
 from .platform_utils import PlatformUtils
 
+def _import_whisper():
+    """Import whisper on first use."""
+    global whisper
+    if whisper is None:
+        import whisper as _whisper
+        whisper = _whisper
+    return whisper
+
+
+def _import_torch():
+    """Import torch on first use."""
+    global torch
+    if torch is None:
+        import torch as _torch
+        torch = _torch
+    return torch
+
+
+def _import_torchaudio():
+    """Import torchaudio on first use."""
+    global torchaudio
+    if torchaudio is None:
+        import torchaudio as _torchaudio
+        torchaudio = _torchaudio
+    return torchaudio
+
+
+def _model_cache_dir() -> Path:
+    """Directory holding re-serialized models that can be memory-mapped."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'mp4totext'
+
+
+def _drop_repeated_words(previous_words: List[str], words: List[str], max_overlap: int = 8) -> List[str]:
+    """
+    Remove words at the start of a chunk that repeat the end of the previous one.
+    
+    Args:
+        previous_words: Words kept so far
+        words: Words of the next chunk
+        max_overlap: Longest repetition to look for
+        
+    Returns:
+        The words of the next chunk without the repeated prefix
+    """
+    def normalize(word: str) -> str:
+        return word.strip('.,!?;:"\'').lower()
+    
+    longest = min(max_overlap, len(previous_words), len(words))
+    for size in range(longest, 0, -1):
+        if [normalize(w) for w in previous_words[-size:]] == [normalize(w) for w in words[:size]]:
+            return words[size:]
+    return words
+
+
+# Accelerator availability is probed once; each probe touches the driver
+@functools.lru_cache(maxsize=None)
+def _has_cuda() -> bool:
+    return TORCH_AVAILABLE and _import_torch().cuda.is_available()
+
+
+@functools.lru_cache(maxsize=None)
+def _has_mps() -> bool:
+    if not TORCH_AVAILABLE:
+        return False
+    backends = _import_torch().backends
+    return hasattr(backends, 'mps') and backends.mps.is_available()
+
+
+@functools.lru_cache(maxsize=None)
+def _supports_assign() -> bool:
+    """Whether load_state_dict can adopt tensors in place (torch >= 2.1)."""
+    if not TORCH_AVAILABLE:
+        return False
+    import inspect
+    return 'assign' in inspect.signature(_import_torch().nn.Module.load_state_dict).parameters
+
+
+# Sample rate expected by Whisper models
+WHISPER_SAMPLE_RATE = 16000
+
+# Generous speech rate used to presize per-word buffers
+WORDS_PER_SECOND_ESTIMATE = 3
+
+# dataclass(slots=True) requires Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_milliseconds(total_ms: int, separator: str) -> str:
+    """Format integer milliseconds as HH:MM:SS, plus separator and milliseconds if given."""
+    hours, remainder = divmod(total_ms, 3_600_000)
+    minutes, remainder = divmod(remainder, 60_000)
+    secs, milliseconds = divmod(remainder, 1000)
+    if separator:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{milliseconds:03d}"
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def _format_timestamp(seconds: float, separator: str = '') -> str:
+    """
+    Format a timestamp for transcript output.
+    
+    Args:
+        seconds: Time in seconds
+        separator: Millisecond separator (',' for SRT, '.' for WebVTT);
+            empty for whole seconds only
+    """
+    # Segment boundaries repeat (one cue's end is the next one's start), so cache on ms
+    return _format_milliseconds(round(seconds * 1000), separator)
+
+
+# Segment keys stored as columns; any others (seek, tokens, avg_logprob,
+# no_speech_prob, ...) are kept per segment in SegmentTable.extra
+_SEGMENT_COLUMNS = frozenset({'id', 'start', 'end', 'text', 'words'})
 
-@dataclass
+
+class SegmentTable(NamedTuple):
+    """
+    Column-wise storage for transcription segments and their words.
+    
+    Words of segment ``i`` are ``word_*[word_offsets[i]:word_offsets[i + 1]]``.
+    """
+    start: 'np.ndarray'
+    end: 'np.ndarray'
+    text: List[str]
+    extra: List[Dict]
+    word_offsets: 'np.ndarray'
+    word_text: List[str]
+    word_starts: 'np.ndarray'
+    word_ends: 'np.ndarray'
+    word_probs: 'np.ndarray'
+    
+    @classmethod
+    def from_segments(cls, segments: List[Dict], include_words: bool = True,
+                      estimated_words: int = 0) -> 'SegmentTable':
+        """
+        Build a table from Whisper's list-of-dicts segment output.
+        
+        Args:
+            segments: Whisper segment dictionaries
+            include_words: Whether to collect per-word columns
+            estimated_words: Initial capacity of the word columns; they grow
+                geometrically if the estimate is exceeded
+        """
+        num_segments = len(segments)
+        capacity = max(64, estimated_words) if include_words else 0
+        
+        start = np.empty(num_segments, dtype=np.float64)
+        end = np.empty(num_segments, dtype=np.float64)
+        word_offsets = np.empty(num_segments + 1, dtype=np.int64)
+        word_starts = np.empty(capacity, dtype=np.float64)
+        word_ends = np.empty(capacity, dtype=np.float64)
+        word_probs = np.empty(capacity, dtype=np.float64)
+        text = []
+        extra = []
+        word_text = []
+        
+        n = 0
+        word_offsets[0] = 0
+        for i, segment in enumerate(segments):
+            start[i] = segment.get('start', 0.0)
+            end[i] = segment.get('end', 0.0)
+            text.append(segment.get('text', '').strip())
+            extra.append({k: v for k, v in segment.items() if k not in _SEGMENT_COLUMNS})
+            
+            for word in (segment.get('words') or ()) if include_words else ():
+                if n >= capacity:
+                    capacity *= 2
+                    word_starts = np.resize(word_starts, capacity)
+                    word_ends = np.resize(word_ends, capacity)
+                    word_probs = np.resize(word_probs, capacity)
+                
+                word_text.append(word.get('word', ''))
+                word_starts[n] = word.get('start', 0.0)
+                word_ends[n] = word.get('end', 0.0)
+                word_probs[n] = word.get('probability', 0.0)
+                n += 1
+            word_offsets[i + 1] = n
+        
+        return cls(start, end, text, extra, word_offsets, word_text,
+                   word_starts[:n], word_ends[:n], word_probs[:n])
+    
+    @property
+    def num_segments(self) -> int:
+        return len(self.text)
+    
+    @property
+    def num_words(self) -> int:
+        return len(self.word_text)
+    
+    def to_dicts(self) -> List[Dict]:
+        """Expand the table back into Whisper-style segment dictionaries, extra fields included."""
+        offsets = self.word_offsets.tolist()
+        word_starts = self.word_starts.tolist()
+        word_ends = self.word_ends.tolist()
+        word_probs = self.word_probs.tolist()
+        
+        segments = []
+        for i, (start, end, text) in enumerate(zip(self.start.tolist(), self.end.tolist(), self.text)):
+            words = [
+                {
+                    'word': self.word_text[j],
+                    'start': word_starts[j],
+                    'end': word_ends[j],
+                    'probability': word_probs[j]
+                }
+                for j in range(offsets[i], offsets[i + 1])
+            ]
+            segments.append({'id': i, 'start': start, 'end': end, 'text': text,
+                             **self.extra[i], 'words': words})
+        
+        return segments
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TranscriptionResult:
     """Result of transcription process."""
     text: str = ""
-    segments: List[Dict] = None
+    segments: Optional[SegmentTable] = None
     language: str = ""
     duration: float = 0.0
     processing_time: float = 0.0
     model_used: str = ""
     device_used: str = ""
-    confidence_scores: List[float] = None
+    confidence_scores: Optional['np.ndarray'] = None
     
     def __post_init__(self):
         if self.segments is None:
-            self.segments = []
+            self.segments = SegmentTable.from_segments([])
         if self.confidence_scores is None:
-            self.confidence_scores = []
+            self.confidence_scores = self.segments.word_probs
 
 
 class WhisperTranscriber:
@@ -58,8 +298,15 @@ class WhisperTranscriber:
         'large-v3': {'memory_gb': 10, 'relative_speed': 1},
     }
     
+    BACKENDS = ('openai', 'faster', 'transformers')
+    QUANTIZE_MODES = ('none', 'int8', 'int4')
+    DTYPES = ('fp16', 'fp32')
+    ATTN_IMPLS = ('auto', 'sdpa', 'flash_attention_2', 'eager')
+    
     def __init__(self, model_name: str = 'medium', device: str = 'auto', 
-                 download_root: Optional[str] = None):
+                 download_root: Optional[str] = None, use_compile: bool = True,
+                 quantize: Union[bool, str] = 'int8', dtype: str = 'fp16', attn_impl: str = 'auto',
+                 backend: str = 'openai', model_cache: bool = False):
         """
         Initialize Whisper transcriber.
         
@@ -67,15 +314,52 @@ class WhisperTranscriber:
             model_name: Whisper model name
             device: Device to use ('auto', 'cpu', 'cuda', 'mps')
             download_root: Custom download directory for models
+            use_compile: Compile encoder/decoder with torch.compile on CUDA
+            quantize: Weight quantization ('none', 'int8', 'int4'). INT8 applies
+                on CPU to every backend; INT4 needs the transformers backend on
+                CUDA with bitsandbytes and falls back to INT8 on CPU. True/False
+                are accepted as 'int8'/'none'
+            dtype: Weight precision on GPU ('fp16' or 'fp32'); CPU always uses fp32
+            attn_impl: Attention kernels ('auto', 'sdpa', 'flash_attention_2', 'eager');
+                openai-whisper only has a process-wide SDPA switch
+            backend: Inference engine ('openai', 'faster' for faster-whisper/CTranslate2,
+                'transformers' for Hugging Face)
+            model_cache: Keep an mmap-loadable copy of openai-whisper models under
+                $XDG_CACHE_HOME/mp4totext so later runs skip checkpoint parsing.
+                Costs a second full copy of each checkpoint on disk
         """
-        if not WHISPER_AVAILABLE:
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Invalid backend '{backend}'. Available backends: {list(self.BACKENDS)}")
+        if isinstance(quantize, bool):
+            quantize = 'int8' if quantize else 'none'
+        if quantize not in self.QUANTIZE_MODES:
+            raise ValueError(f"Invalid quantization '{quantize}'. Available modes: {list(self.QUANTIZE_MODES)}")
+        if dtype not in self.DTYPES:
+            raise ValueError(f"Invalid dtype '{dtype}'. Available dtypes: {list(self.DTYPES)}")
+        if attn_impl not in self.ATTN_IMPLS:
+            raise ValueError(f"Invalid attention implementation '{attn_impl}'. "
+                             f"Available implementations: {list(self.ATTN_IMPLS)}")
+        if backend == 'openai' and not WHISPER_AVAILABLE:
             raise ImportError("OpenAI Whisper not available. Install with: pip install openai-whisper")
+        if backend == 'faster' and not FASTER_WHISPER_AVAILABLE:
+            raise ImportError("faster-whisper not available. Install with: pip install faster-whisper")
+        if backend == 'transformers' and not TRANSFORMERS_AVAILABLE:
+            raise ImportError("transformers not available. Install with: pip install transformers")
         
         self.platform_utils = PlatformUtils()
         self.model_name = model_name
+        self.backend = backend
+        self.model_cache = model_cache
         self.device = self._resolve_device(device)
         self.model = None
         self.model_load_time = 0.0
+        self.use_compile = use_compile
+        self.model_compiled = False
+        self.quantize = quantize
+        self.quantized_engine = None
+        self._hf_pipeline = None
+        self.dtype = dtype
+        self.attn_impl = attn_impl
         
         # Set download root
         if download_root:
@@ -98,13 +382,13 @@ class WhisperTranscriber:
             
             # Additional validation for detected device
             if detected_device == 'cuda':
-                if TORCH_AVAILABLE and torch.cuda.is_available():
+                if _has_cuda():
                     return 'cuda'
                 else:
                     print("Warning: CUDA detected but not available, falling back to CPU")
                     return 'cpu'
             elif detected_device == 'mps':
-                if TORCH_AVAILABLE and hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+                if _has_mps():
                     return 'mps'
                 else:
                     print("Warning: MPS detected but not available, falling back to CPU")
@@ -113,9 +397,9 @@ class WhisperTranscriber:
                 return 'cpu'
         else:
             # Validate requested device
-            if device == 'cuda' and not (TORCH_AVAILABLE and torch.cuda.is_available()):
+            if device == 'cuda' and not _has_cuda():
                 raise ValueError("CUDA requested but not available")
-            elif device == 'mps' and not (TORCH_AVAILABLE and hasattr(torch.backends, 'mps') and torch.backends.mps.is_available()):
+            elif device == 'mps' and not _has_mps():
                 raise ValueError("MPS requested but not available")
             
             return device
@@ -136,12 +420,14 @@ class WhisperTranscriber:
             print(f"Warning: Model '{self.model_name}' requires {required_memory}GB memory, "
                   f"but only {available_memory:.1f}GB available. Performance may be affected.")
     
-    def load_model(self, force_reload: bool = False) -> bool:
+    def load_model(self, force_reload: bool = False, compile_model: bool = True) -> bool:
         """
         Load Whisper model with error handling.
         
         Args:
             force_reload: Force reload even if model is already loaded
+            compile_model: Apply torch.compile (and its warmup) if use_compile is set;
+                pass False when the model is only exported to other processes
             
         Returns:
             True if successfully loaded, False otherwise
@@ -153,15 +439,28 @@ class WhisperTranscriber:
             print(f"Loading Whisper model '{self.model_name}' on device '{self.device}'...")
             start_time = time.time()
             
+            if self.backend != 'openai':
+                self.model = self._load_backend_model()
+                self.model_load_time = time.time() - start_time
+                print(f"Model loaded successfully in {self.model_load_time:.1f} seconds")
+                return True
+            
+            _import_whisper()
+            _import_torch()
+            
             # Create download directory if it doesn't exist
             self.download_root.mkdir(parents=True, exist_ok=True)
             
             # Load model with device specification
-            self.model = whisper.load_model(
-                self.model_name, 
-                device=self.device,
-                download_root=str(self.download_root)
-            )
+            self.model = self._load_openai_model(self.device)
+            
+            self._release_load_buffers()
+            
+            if self.quantize != 'none':
+                self._quantize_model()
+            
+            if self.use_compile and compile_model:
+                self._compile_model()
             
             self.model_load_time = time.time() - start_time
             
@@ -172,15 +471,14 @@ class WhisperTranscriber:
             print(f"Error loading Whisper model: {e}")
             
             # Try fallback to CPU if GPU loading failed
-            if self.device != 'cpu':
+            if self.device != 'cpu' and self.backend == 'openai':
                 print("Attempting fallback to CPU...")
                 try:
                     self.device = 'cpu'
-                    self.model = whisper.load_model(
-                        self.model_name,
-                        device='cpu',
-                        download_root=str(self.download_root)
-                    )
+                    self.model = self._load_openai_model('cpu')
+                    self._release_load_buffers()
+                    if self.quantize != 'none':
+                        self._quantize_model()
                     self.model_load_time = time.time() - start_time
                     print(f"Fallback to CPU successful")
                     return True
@@ -189,22 +487,589 @@ class WhisperTranscriber:
             
             return False
     
-    def transcribe(self, audio_path: Path, language: str = 'auto',
+    def _build_model_from_state_dict(self, dims: Dict[str, int], state_dict: Dict[str, Any]):
+        """
+        Build an openai-whisper model that adopts the given tensors.
+        
+        The module is created on the meta device, so no weights are allocated
+        or randomly initialized only to be replaced; load_state_dict(assign=True)
+        then takes the tensors as they are (memory-mapped or shared CUDA).
+        Non-persistent buffers are not in the state dict and are rebuilt.
+        
+        Args:
+            dims: Model dimensions
+            state_dict: Weights to adopt
+            
+        Returns:
+            Whisper model on the device its tensors live on
+            
+        Raises:
+            RuntimeError: If torch is older than 2.1 (no assign=True)
+        """
+        if not _supports_assign():
+            raise RuntimeError("Adopting a state dict requires torch >= 2.1")
+        
+        dims = whisper.model.ModelDimensions(**dims)
+        with torch.device('meta'):
+            model = whisper.model.Whisper(dims)
+        model.load_state_dict(state_dict, assign=True)
+        
+        # Causal attention mask of the text decoder
+        if model.decoder.mask.is_meta:
+            n_ctx = dims.n_text_ctx
+            model.decoder.register_buffer(
+                'mask', torch.empty(n_ctx, n_ctx).fill_(float('-inf')).triu_(1), persistent=False
+            )
+        
+        # Alignment heads, as in whisper.load_model; unknown models use the
+        # upper half of the decoder layers like Whisper.__init__
+        alignment_heads = getattr(whisper, '_ALIGNMENT_HEADS', {}).get(self.model_name)
+        if alignment_heads is not None:
+            model.set_alignment_heads(alignment_heads)
+        elif model.alignment_heads.is_meta:
+            all_heads = torch.zeros(dims.n_text_layer, dims.n_text_head, dtype=torch.bool)
+            all_heads[dims.n_text_layer // 2:] = True
+            model.register_buffer('alignment_heads', all_heads.to_sparse(), persistent=False)
+        
+        missing = [name for name, tensor in model.state_dict(keep_vars=True).items() if tensor.is_meta]
+        if missing:
+            raise RuntimeError(f"Weights missing from state dict: {missing}")
+        return model
+    
+    def _load_openai_model(self, device: str):
+        """
+        Load an openai-whisper model, preferring the memory-mapped cache.
+        
+        whisper.load_model() reads and unpickles the whole checkpoint on every
+        run. The cached copy is saved in torch's zip format, so its tensors are
+        mapped from disk and assigned to the model without an extra copy.
+        
+        Args:
+            device: Device to place the model on
+            
+        Returns:
+            Loaded Whisper model
+        """
+        cache_path = _model_cache_dir() / f"{self.model_name}.pt"
+        
+        if self.model_cache and cache_path.exists():
+            try:
+                checkpoint = torch.load(cache_path, map_location='cpu', mmap=True, weights_only=True)
+                model = self._build_model_from_state_dict(checkpoint['dims'], checkpoint['model_state_dict'])
+                return model.to(device)
+            except Exception as e:
+                # Older torch (no mmap/assign) or a stale cache: fall back to Whisper's loader
+                print(f"Warning: Model cache {cache_path} not usable: {e}")
+        
+        model = whisper.load_model(
+            self.model_name,
+            device=device,
+            download_root=str(self.download_root)
+        )
+        
+        if self.model_cache and not cache_path.exists():
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix('.tmp')
+                torch.save({'dims': vars(model.dims), 'model_state_dict': model.state_dict()}, tmp_path)
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                print(f"Warning: Failed to write model cache {cache_path}: {e}")
+        
+        return model
+    
+    def export_shared_model(self) -> Dict[str, Any]:
+        """
+        Export the loaded openai-whisper weights for other processes.
+        
+        When pickled for a spawned process, CUDA tensors travel as IPC handles,
+        so every receiver maps the same device memory instead of holding its
+        own copy. The exporting process must keep its model loaded for as long
+        as receivers use it.
+        
+        Returns:
+            Dict with the model dimensions and state dict
+        """
+        # Registers the CUDA tensor reducers with multiprocessing's pickler
+        import torch.multiprocessing  # noqa: F401
+        
+        state_dict = {
+            # torch.compile wraps the encoder/decoder; store plain module keys
+            name.replace('_orig_mod.', ''): tensor
+            for name, tensor in self.model.state_dict().items()
+        }
+        return {'dims': vars(self.model.dims), 'state_dict': state_dict}
+    
+    def load_shared_model(self, shared_model: Dict[str, Any]) -> bool:
+        """
+        Build the model around weights exported by export_shared_model().
+        
+        Args:
+            shared_model: Dict with the model dimensions and state dict
+            
+        Returns:
+            True once the model is ready
+        """
+        _import_whisper()
+        _import_torch()
+        
+        start_time = time.time()
+        # Adopts the shared CUDA tensors without building a CPU copy first;
+        # to() only moves the rebuilt non-persistent buffers
+        try:
+            model = self._build_model_from_state_dict(shared_model['dims'], shared_model['state_dict'])
+        except Exception as e:
+            print(f"Warning: Cannot use shared model, loading a private copy: {e}")
+            return self.load_model()
+        self.model = model.to(self.device)
+        
+        if self.use_compile:
+            self._compile_model()
+        
+        self.model_load_time = time.time() - start_time
+        return True
+    
+    def _load_backend_model(self):
+        """Load the model for the faster-whisper or transformers backend."""
+        if self.backend == 'transformers':
+            return self._load_hf_pipeline()
+        
+        from faster_whisper import WhisperModel
+        
+        # CTranslate2 has no MPS kernels; INT8 is its fast path on CPU
+        if self.device == 'mps':
+            print("Warning: faster-whisper does not support MPS, using CPU")
+            self.device = 'cpu'
+        if self.device == 'cpu':
+            compute_type = 'float32' if self.quantize == 'none' else 'int8'
+        else:
+            if self.quantize == 'int4':
+                print("Warning: CTranslate2 has no INT4 kernels, loading unquantized weights")
+            compute_type = 'float16' if self.dtype == 'fp16' else 'float32'
+        
+        self.download_root.mkdir(parents=True, exist_ok=True)
+        return WhisperModel(
+            self.model_name,
+            device=self.device,
+            compute_type=compute_type,
+            download_root=str(self.download_root)
+        )
+    
+    def _transcribe_faster(self, audio: 'np.ndarray', options: Dict[str, Any],
+                           progress_callback: Optional[Callable[[float], None]] = None) -> Dict[str, Any]:
+        """
+        Transcribe with faster-whisper.
+        
+        Args:
+            audio: 16 kHz mono samples
+            options: Transcription options in openai-whisper naming
+            progress_callback: Called with the decoded fraction after every segment
+            
+        Returns:
+            Result in openai-whisper's layout (text, segments, language)
+        """
+        segments, info = self.model.transcribe(
+            audio,
+            language=options.get('language'),
+            beam_size=1,
+            vad_filter=True,
+            word_timestamps=options['word_timestamps'],
+            condition_on_previous_text=options['condition_on_previous_text'],
+            temperature=options['temperature']
+        )
+        
+        # segments is a generator; decoding happens while it is consumed
+        converted = []
+        for segment in segments:
+            converted.append({
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+                'words': [
+                    {'word': w.word, 'start': w.start, 'end': w.end, 'probability': w.probability}
+                    for w in segment.words or ()
+                ]
+            })
+            if progress_callback and info.duration > 0:
+                progress_callback(min(segment.end / info.duration, 1.0))
+        
+        return {
+            'text': ''.join(segment['text'] for segment in converted),
+            'segments': converted,
+            'language': info.language
+        }
+    
+    def _use_fp16(self) -> bool:
+        """Whether openai-whisper weights and decoding run in FP16."""
+        return self.device == 'cuda' and self.dtype == 'fp16'
+    
+    def _resolve_attn_impl(self) -> str:
+        """Resolve 'auto' to FlashAttention 2 on Ampere or newer GPUs, SDPA otherwise."""
+        if self.attn_impl != 'auto':
+            return self.attn_impl
+        
+        # A100/H100/L40S and other compute capability 8.x+ parts run FA2 kernels
+        if FLASH_ATTN_AVAILABLE and self.device == 'cuda' and _has_cuda():
+            major, _ = torch.cuda.get_device_capability()
+            if major >= 8:
+                return 'flash_attention_2'
+        return 'sdpa'
+    
+    def _release_load_buffers(self):
+        """Convert weights to their runtime layout and free load-time staging memory."""
+        if not TORCH_AVAILABLE:
+            return
+        
+        if self._use_fp16():
+            # FP16 halves both weight storage and memory bandwidth during decoding
+            self.model = self.model.half()
+        
+        # openai-whisper runs attention through PyTorch SDPA unless told otherwise.
+        # qkv_attention() reads the switch as MultiHeadAttention.use_sdpa, so it
+        # cannot be set per instance: it applies to every openai-whisper model in
+        # this process, and the last loaded transcriber's attn_impl wins
+        mha = getattr(getattr(whisper, 'model', None), 'MultiHeadAttention', None)
+        if mha is not None and hasattr(mha, 'use_sdpa'):
+            mha.use_sdpa = self._resolve_attn_impl() != 'eager'
+        
+        with torch.no_grad():
+            for param in self.model.parameters():
+                param.data = param.data.contiguous()
+        
+        # Drop the host-side checkpoint copy held since whisper.load_model
+        gc.collect()
+        
+        if self.device == 'cuda':
+            if hasattr(torch._C, '_cuda_clearCublasWorkspaces'):
+                torch._C._cuda_clearCublasWorkspaces()
+            torch.cuda.empty_cache()
+    
+    def _quantize_model(self):
+        """Apply dynamic INT8 quantization to Linear layers (CPU only)."""
+        self.quantized_engine = None
+        if self.device != 'cpu':
+            if self.quantize == 'int4':
+                print("Warning: INT4 quantization needs the transformers backend on CUDA, "
+                      "loading unquantized weights")
+            return
+        if not TORCH_AVAILABLE:
+            return
+        if self.quantize == 'int4':
+            # Dynamic quantization only has 8-bit kernels on CPU
+            print("Warning: INT4 is not available on CPU, using INT8")
+        
+        # fbgemm uses the x86 VNNI kernels, qnnpack the ARM ones
+        is_arm = platform.machine().lower() in ('arm64', 'aarch64')
+        engine = 'qnnpack' if is_arm else 'fbgemm'
+        if engine not in torch.backends.quantized.supported_engines:
+            print(f"Warning: Quantization engine '{engine}' not supported, keeping FP32 model")
+            return
+        
+        try:
+            torch.backends.quantized.engine = engine
+            
+            # Whisper's Linear subclass only casts weights to the input dtype, a
+            # no-op in FP32 on CPU; quantize_dynamic matches exact module types
+            for module in self.model.modules():
+                if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+                    module.__class__ = torch.nn.Linear
+            
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            self.quantized_engine = engine
+            print(f"Model quantized to INT8 ({engine})")
+        except Exception as e:
+            print(f"Warning: Dynamic quantization failed, keeping FP32 model: {e}")
+    
+    def _compile_model(self):
+        """Compile encoder and decoder with torch.compile (CUDA, PyTorch 2.x only)."""
+        self.model_compiled = False
+        if self.device != 'cuda' or not (TORCH_AVAILABLE and hasattr(torch, 'compile')):
+            return
+        
+        encoder, decoder = self.model.encoder, self.model.decoder
+        try:
+            self.model.encoder = torch.compile(encoder, mode='reduce-overhead')
+            self.model.decoder = torch.compile(decoder, mode='reduce-overhead')
+            
+            # Trace now so the first real transcription does not pay for compilation
+            self.warmup()
+            self.model_compiled = True
+            print("Model compiled with torch.compile")
+        except Exception as e:
+            self.model.encoder, self.model.decoder = encoder, decoder
+            print(f"Warning: torch.compile failed, using eager model: {e}")
+    
+    def warmup(self, seconds: float = 1.0):
+        """
+        Run a short transcription of silence to trigger lazy initialization.
+        
+        Args:
+            seconds: Length of the silent warmup clip
+        """
+        if not self.load_model():
+            raise RuntimeError("Failed to load Whisper model")
+        
+        silence = np.zeros(int(WHISPER_SAMPLE_RATE * seconds), dtype=np.float32)
+        self.model.transcribe(silence, verbose=None, temperature=0.0,
+                              fp16=self._use_fp16())
+    
+    def _load_audio(self, audio_path: Union[Path, 'np.ndarray']) -> Union['np.ndarray', 'torch.Tensor']:
+        """
+        Load audio as 16 kHz mono float32 samples without spawning FFmpeg.
+        
+        Args:
+            audio_path: Path to audio file, or samples that are already decoded
+            
+        Returns:
+            Sample array, or a tensor already on the transcription device when
+            resampling was needed
+        """
+        if isinstance(audio_path, np.ndarray):
+            return audio_path
+        
+        if SOUNDFILE_AVAILABLE:
+            try:
+                data, sample_rate = soundfile.read(str(audio_path), dtype='float32', always_2d=False)
+            except Exception:
+                # Container soundfile cannot decode (e.g. MP4): let FFmpeg handle it
+                data = None
+            
+            if data is not None:
+                if data.ndim == 2:
+                    data = data.mean(axis=1, dtype=np.float32)
+                
+                if sample_rate == WHISPER_SAMPLE_RATE:
+                    return data
+                
+                if TORCHAUDIO_AVAILABLE:
+                    # The faster backend never loads torch itself
+                    _import_torch()
+                    _import_torchaudio()
+                    samples = torch.from_numpy(data).to(self.device)
+                    return torchaudio.functional.resample(samples, sample_rate, WHISPER_SAMPLE_RATE)
+        
+        return _import_whisper().load_audio(str(audio_path))
+    
+    def _load_hf_pipeline(self):
+        """Build the Hugging Face ASR pipeline used by transcribe_batch()."""
+        if self._hf_pipeline is None:
+            _import_torch()
+            from transformers import pipeline
+            
+            if self.device == 'cpu' or self.dtype == 'fp32':
+                torch_dtype = torch.float32
+            else:
+                torch_dtype = torch.float16
+            
+            model_kwargs = {'attn_implementation': self._resolve_attn_impl()}
+            placement = {'device': self.device}
+            if self.quantize == 'int4' and self.device == 'cuda':
+                if BITSANDBYTES_AVAILABLE:
+                    from transformers import BitsAndBytesConfig
+                    model_kwargs['quantization_config'] = BitsAndBytesConfig(
+                        load_in_4bit=True, bnb_4bit_compute_dtype=torch.float16
+                    )
+                    # bitsandbytes places the weights itself; the model cannot be moved afterwards
+                    placement = {'device_map': 'auto'}
+                else:
+                    print("Warning: INT4 quantization requires bitsandbytes (pip install bitsandbytes), "
+                          "loading unquantized weights")
+            
+            print(f"Loading batched pipeline for '{self.model_name}' on device '{self.device}'...")
+            self._hf_pipeline = pipeline(
+                'automatic-speech-recognition',
+                model=f"openai/whisper-{self.model_name}",
+                torch_dtype=torch_dtype,
+                model_kwargs=model_kwargs,
+                **placement
+            )
+            if self.device == 'cpu' and self.quantize != 'none':
+                self._quantize_pipeline()
+        return self._hf_pipeline
+    
+    def _quantize_pipeline(self):
+        """Apply dynamic INT8 quantization to the transformers pipeline's model on CPU."""
+        try:
+            self._hf_pipeline.model = torch.quantization.quantize_dynamic(
+                self._hf_pipeline.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            self.quantized_engine = torch.backends.quantized.engine
+            print(f"Model quantized to INT8 ({self.quantized_engine})")
+        except Exception as e:
+            print(f"Warning: Dynamic quantization failed, keeping FP32 model: {e}")
+    
+    def transcribe_batch(self, audio_paths: List[Union[Path, 'np.ndarray']], language: str = 'auto',
+                         batch_size: int = 8) -> List[TranscriptionResult]:
+        """
+        Transcribe several audio files with batched inference.
+        
+        Every file is cut into 30 second chunks and chunks from all files are
+        decoded batch_size at a time through a transformers pipeline, instead
+        of one sequential decode per file.
+        
+        Args:
+            audio_paths: Paths to audio files or 16 kHz mono float32 sample arrays
+            language: Language code ('auto' for auto-detection)
+            batch_size: Number of 30 second chunks per forward pass
+            
+        Returns:
+            One TranscriptionResult per audio path, in the same order
+        """
+        if not TRANSFORMERS_AVAILABLE:
+            raise ImportError("transformers not available. Install with: pip install transformers")
+        
+        pipe = self._load_hf_pipeline()
+        start_time = time.time()
+        
+        inputs = []
+        for audio_path in audio_paths:
+            audio = self._load_audio(audio_path)
+            if not isinstance(audio, np.ndarray):
+                audio = audio.cpu().numpy()
+            inputs.append({'raw': audio, 'sampling_rate': WHISPER_SAMPLE_RATE})
+        durations = [item['raw'].shape[-1] / WHISPER_SAMPLE_RATE for item in inputs]
+        
+        generate_kwargs = {'task': 'transcribe'}
+        if language != 'auto' and language:
+            generate_kwargs['language'] = language
+        
+        print(f"Transcribing {len(inputs)} audio files in batches of {batch_size}")
+        outputs = pipe(inputs, chunk_length_s=30, batch_size=batch_size,
+                       return_timestamps=True, generate_kwargs=generate_kwargs)
+        
+        # The files share forward passes, so split the wall time evenly
+        processing_time = (time.time() - start_time) / max(1, len(inputs))
+        
+        results = []
+        for output, duration in zip(outputs, durations):
+            segments = SegmentTable.from_segments(
+                [
+                    {
+                        'start': chunk['timestamp'][0] or 0.0,
+                        # The final chunk of a file can be left open-ended
+                        'end': duration if chunk['timestamp'][1] is None else chunk['timestamp'][1],
+                        'text': chunk['text']
+                    }
+                    for chunk in output.get('chunks') or []
+                ],
+                include_words=False
+            )
+            results.append(TranscriptionResult(
+                text=output.get('text', '').strip(),
+                segments=segments,
+                language=language,
+                duration=duration,
+                processing_time=processing_time,
+                model_used=self.model_name,
+                device_used=self.device
+            ))
+        
+        return results
+    
+    def transcribe_chunks(self, chunks: List['np.ndarray'], offsets: List[float],
+                          language: str = 'auto', batch_size: int = 8,
+                          progress_callback: Optional[Callable[[float], None]] = None) -> TranscriptionResult:
+        """
+        Transcribe the chunks of one long recording with batched decoding.
+        
+        Whisper's transcribe() walks a recording one 30 second window at a
+        time. Here independent chunks are decoded batch_size at a time, each
+        batch in a single forward pass; words repeated in the overlap between
+        neighbouring chunks are dropped.
+        
+        Args:
+            chunks: 16 kHz mono float32 chunks of at most 30 seconds
+            offsets: Start time of every chunk in seconds
+            language: Language code ('auto' for auto-detection)
+            batch_size: Chunks decoded per forward pass
+            progress_callback: Called with the decoded fraction after every batch
+            
+        Returns:
+            TranscriptionResult for the whole recording
+        """
+        if self.backend != 'openai':
+            raise ValueError("Chunked decoding requires the openai backend")
+        
+        if not self.load_model():
+            raise RuntimeError("Failed to load Whisper model")
+        
+        start_time = time.time()
+        device = next(self.model.parameters()).device
+        options = whisper.DecodingOptions(
+            language=None if language == 'auto' else language,
+            fp16=self._use_fp16(),
+            without_timestamps=True,
+            temperature=0.0
+        )
+        
+        print(f"Transcribing {len(chunks)} chunks in batches of {batch_size}")
+        
+        decoded = []
+        for i in range(0, len(chunks), batch_size):
+            mel = torch.stack([
+                whisper.log_mel_spectrogram(
+                    whisper.pad_or_trim(torch.from_numpy(chunk)),
+                    n_mels=self.model.dims.n_mels,
+                    device=device
+                )
+                for chunk in chunks[i:i + batch_size]
+            ])
+            with torch.no_grad():
+                decoded.extend(whisper.decode(self.model, mel, options))
+            if progress_callback:
+                progress_callback(len(decoded) / len(chunks))
+        
+        segments = []
+        kept_words: List[str] = []
+        for result, offset, chunk in zip(decoded, offsets, chunks):
+            words = _drop_repeated_words(kept_words, result.text.split())
+            kept_words.extend(words)
+            if words:
+                segments.append({
+                    'start': offset,
+                    'end': offset + len(chunk) / WHISPER_SAMPLE_RATE,
+                    'text': ' '.join(words)
+                })
+        
+        table = SegmentTable.from_segments(segments, include_words=False)
+        transcription_result = TranscriptionResult(
+            text=' '.join(kept_words),
+            segments=table,
+            language=decoded[0].language if decoded else language,
+            duration=offsets[-1] + len(chunks[-1]) / WHISPER_SAMPLE_RATE if chunks else 0.0,
+            processing_time=time.time() - start_time,
+            model_used=self.model_name,
+            device_used=self.device
+        )
+        
+        print(f"Transcription completed in {transcription_result.processing_time:.1f} seconds")
+        return transcription_result
+    
+    def transcribe(self, audio_path: Union[Path, str, 'np.ndarray'], language: str = 'auto',
                   progress_callback: Optional[Callable[[float], None]] = None,
+                  word_timestamps: bool = False,
                   **transcribe_options) -> TranscriptionResult:
         """
         Transcribe audio file to text.
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path (or path string) to audio file, or 16 kHz mono
+                float32 samples
             language: Language code ('auto' for auto-detection)
             progress_callback: Optional progress callback function
+            word_timestamps: Run Whisper's word alignment pass and collect
+                per-word timings and confidence scores (slower)
             **transcribe_options: Additional Whisper transcription options
             
         Returns:
             TranscriptionResult object
         """
-        if not audio_path.exists():
+        if isinstance(audio_path, str):
+            audio_path = Path(audio_path)
+        is_file = isinstance(audio_path, Path)
+        if is_file and not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
         if not self.load_model():
@@ -216,7 +1081,8 @@ class WhisperTranscriber:
             # Prepare transcription options
             options = {
                 'verbose': False,
-                'word_timestamps': True,
+                'word_timestamps': word_timestamps,
+                'fp16': self._use_fp16(),
                 'condition_on_previous_text': True,
                 'temperature': 0.0  # Deterministic output
             }
@@ -228,48 +1094,51 @@ class WhisperTranscriber:
             # Update with user options
             options.update(transcribe_options)
             
-            # Progress callback wrapper
-            if progress_callback:
-                def whisper_progress_hook(current_segment, total_segments):
-                    if total_segments > 0:
-                        progress = current_segment / total_segments
-                        progress_callback(progress)
+            if is_file:
+                print(f"Transcribing audio file: {audio_path.name}")
             else:
-                whisper_progress_hook = None
+                print(f"Transcribing {len(audio_path) / WHISPER_SAMPLE_RATE:.1f}s of audio")
             
-            print(f"Transcribing audio file: {audio_path.name}")
+            if self.backend == 'transformers':
+                return self.transcribe_batch([audio_path], language=language, batch_size=1)[0]
+            
+            audio = self._load_audio(audio_path)
+            audio_duration = audio.shape[-1] / WHISPER_SAMPLE_RATE
             
             # Perform transcription
-            result = self.model.transcribe(
-                str(audio_path),
-                **options
-            )
+            if self.backend == 'faster':
+                if not isinstance(audio, np.ndarray):
+                    audio = audio.cpu().numpy()
+                result = self._transcribe_faster(audio, options, progress_callback)
+            else:
+                result = self.model.transcribe(
+                    audio,
+                    **options
+                )
             
             processing_time = time.time() - start_time
             
-            # Extract confidence scores if available
-            confidence_scores = []
-            if 'segments' in result and result['segments']:
-                for segment in result['segments']:
-                    if 'words' in segment and segment['words']:
-                        word_confidences = [word.get('probability', 0.0) for word in segment['words']]
-                        confidence_scores.extend(word_confidences)
+            # Store segments column-wise; word probabilities double as confidence scores
+            segments = SegmentTable.from_segments(
+                result.get('segments') or [],
+                include_words=options['word_timestamps'],
+                estimated_words=int(audio_duration * WORDS_PER_SECOND_ESTIMATE)
+            )
             
             # Create result object
             transcription_result = TranscriptionResult(
                 text=result.get('text', '').strip(),
-                segments=result.get('segments', []),
+                segments=segments,
                 language=result.get('language', language),
                 processing_time=processing_time,
                 model_used=self.model_name,
                 device_used=self.device,
-                confidence_scores=confidence_scores
+                confidence_scores=segments.word_probs
             )
             
             # Get audio duration from result if available
-            if result.get('segments'):
-                last_segment = result['segments'][-1]
-                transcription_result.duration = last_segment.get('end', 0.0)
+            if segments.num_segments:
+                transcription_result.duration = float(segments.end[-1])
             
             print(f"Transcription completed in {processing_time:.1f} seconds")
             print(f"Detected language: {transcription_result.language}")
@@ -321,48 +1190,44 @@ class WhisperTranscriber:
     
     def _save_txt(self, result: TranscriptionResult, output_path: Path, include_timestamps: bool):
         """Save as plain text file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if include_timestamps and result.segments:
-                for segment in result.segments:
-                    start_time = self._format_timestamp(segment.get('start', 0))
-                    end_time = self._format_timestamp(segment.get('end', 0))
-                    text = segment.get('text', '').strip()
-                    f.write(f"[{start_time} --> {end_time}] {text}\n")
-            else:
-                f.write(result.text)
-                if result.text and not result.text.endswith('\n'):
-                    f.write('\n')
+        segments = result.segments
+        if include_timestamps and segments.num_segments:
+            lines = [
+                f"[{_format_timestamp(start)} --> {_format_timestamp(end)}] {text}\n"
+                for start, end, text in zip(segments.start.tolist(), segments.end.tolist(), segments.text)
+            ]
+            content = ''.join(lines)
+        else:
+            content = result.text
+            if content and not content.endswith('\n'):
+                content += '\n'
+        
+        self._write_text(output_path, content)
     
     def _save_srt(self, result: TranscriptionResult, output_path: Path):
         """Save as SRT subtitle file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if result.segments:
-                for i, segment in enumerate(result.segments, 1):
-                    start_time = self._format_timestamp_srt(segment.get('start', 0))
-                    end_time = self._format_timestamp_srt(segment.get('end', 0))
-                    text = segment.get('text', '').strip()
-                    
-                    f.write(f"{i}\n")
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{text}\n\n")
+        segments = result.segments
+        rows = zip(segments.start.tolist(), segments.end.tolist(), segments.text)
+        cues = [
+            f"{i}\n{_format_timestamp(start, ',')} --> {_format_timestamp(end, ',')}\n{text}\n\n"
+            for i, (start, end, text) in enumerate(rows, 1)
+        ]
+        
+        self._write_text(output_path, ''.join(cues))
     
     def _save_vtt(self, result: TranscriptionResult, output_path: Path):
         """Save as WebVTT subtitle file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("WEBVTT\n\n")
-            
-            if result.segments:
-                for segment in result.segments:
-                    start_time = self._format_timestamp_vtt(segment.get('start', 0))
-                    end_time = self._format_timestamp_vtt(segment.get('end', 0))
-                    text = segment.get('text', '').strip()
-                    
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{text}\n\n")
+        segments = result.segments
+        cues = [
+            f"{_format_timestamp(start, '.')} --> {_format_timestamp(end, '.')}\n{text}\n\n"
+            for start, end, text in zip(segments.start.tolist(), segments.end.tolist(), segments.text)
+        ]
+        
+        self._write_text(output_path, "WEBVTT\n\n" + ''.join(cues))
     
     def _save_json(self, result: TranscriptionResult, output_path: Path):
         """Save as JSON file with detailed information."""
-        import json
+        confidence_scores = result.confidence_scores
         
         # Convert result to dictionary
         result_dict = {
@@ -372,37 +1237,45 @@ class WhisperTranscriber:
             'processing_time': result.processing_time,
             'model_used': result.model_used,
             'device_used': result.device_used,
-            'segments': result.segments,
-            'confidence_scores': result.confidence_scores,
+            'segments': result.segments.to_dicts(),
+            'confidence_scores': confidence_scores.tolist(),
             'metadata': {
-                'average_confidence': sum(result.confidence_scores) / len(result.confidence_scores) if result.confidence_scores else 0.0,
-                'total_segments': len(result.segments),
-                'total_words': sum(len(seg.get('words', [])) for seg in result.segments)
+                'average_confidence': float(confidence_scores.mean()) if confidence_scores.size else 0.0,
+                'total_segments': result.segments.num_segments,
+                'total_words': result.segments.num_words
             }
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result_dict, f, indent=2, ensure_ascii=False)
-    
-    def _format_timestamp(self, seconds: float) -> str:
-        """Format timestamp for text output."""
-        hours, remainder = divmod(int(seconds), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-    
-    def _format_timestamp_srt(self, seconds: float) -> str:
-        """Format timestamp for SRT format."""
-        hours, remainder = divmod(int(seconds), 3600)
-        minutes, secs = divmod(remainder, 60)
-        milliseconds = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
-    
-    def _format_timestamp_vtt(self, seconds: float) -> str:
-        """Format timestamp for WebVTT format."""
-        hours, remainder = divmod(int(seconds), 3600)
-        minutes, secs = divmod(remainder, 60)
-        milliseconds = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(result_dict, option=orjson.OPT_INDENT_2)
+        else:
+            content = json.dumps(result_dict, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        self._write_bytes(output_path, content)
+    
+    def _write_text(self, output_path: Path, content: str):
+        """Write UTF-8 text in a single binary write, without newline translation."""
+        self._write_bytes(output_path, content.encode('utf-8'))
+    
+    def _write_bytes(self, output_path: Path, data: bytes):
+        """
+        Write a file atomically: a killed run leaves the old file or none, never a partial one.
+        
+        The data goes to a hidden temporary file in the same directory, which
+        is then renamed over the target. No fsync is issued; a transcript can
+        be regenerated, so only crash-consistency of the name matters.
+        """
+        temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            raise
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about current model."""
@@ -411,10 +1284,16 @@ class WhisperTranscriber:
         
         return {
             'model_name': self.model_name,
+            'backend': self.backend,
             'device': self.device,
             'memory_requirement_gb': model_config.get('memory_gb', 0),
             'relative_speed': model_config.get('relative_speed', 1),
             'model_loaded': self.model is not None,
+            'model_compiled': self.model_compiled,
+            'quantize': self.quantize,
+            'quantized_engine': self.quantized_engine,
+            'dtype': 'fp16' if self._use_fp16() else 'fp32',
+            'attn_impl': self._resolve_attn_impl() if torch is not None else self.attn_impl,
             'model_load_time': self.model_load_time,
             'download_root': str(self.download_root),
             'available_device': device_name,
@@ -423,18 +1302,18 @@ class WhisperTranscriber:
     
     def unload_model(self):
         """Unload model to free memory."""
-        if self.model is not None:
+        if self.model is not None or self._hf_pipeline is not None:
             del self.model
             self.model = None
+            self._hf_pipeline = None
             
             # Force garbage collection if torch is available
-            if TORCH_AVAILABLE:
-                import gc
+            if torch is not None:
                 gc.collect()
                 
-                if torch.cuda.is_available():
+                if _has_cuda():
                     torch.cuda.empty_cache()
-                elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+                elif _has_mps():
                     torch.mps.empty_cache()
             
             print("Whisper model unloaded")
@@ -443,9 +1322,12 @@ class WhisperTranscriber:
         """
         Benchmark transcription performance.
         
+        An extra warmup run is performed first and excluded from the statistics,
+        so one-off costs (compilation, cold disk cache) do not skew the results.
+        
         Args:
             test_audio_path: Path to test audio file
-            num_runs: Number of benchmark runs
+            num_runs: Number of measured benchmark runs
             
         Returns:
             Dictionary with benchmark results
@@ -456,28 +1338,86 @@ class WhisperTranscriber:
         if not self.load_model():
             raise RuntimeError("Failed to load model for benchmarking")
         
-        print(f"Benchmarking {self.model_name} on {self.device} ({num_runs} runs)...")
+        print(f"Benchmarking {self.model_name} on {self.device} ({num_runs} runs + warmup)...")
         
         times = []
-        for run in range(num_runs):
-            print(f"Run {run + 1}/{num_runs}...")
+        for run in range(num_runs + 1):
+            print("Warmup run..." if run == 0 else f"Run {run}/{num_runs}...")
             result = self.transcribe(test_audio_path)
-            times.append(result.processing_time)
+            if run > 0:
+                times.append(result.processing_time)
         
         # Calculate statistics
-        avg_time = sum(times) / len(times)
-        min_time = min(times)
-        max_time = max(times)
+        median_time = statistics.median(times)
         
         return {
-            'average_time': avg_time,
-            'min_time': min_time,
-            'max_time': max_time,
+            'average_time': statistics.mean(times),
+            'median_time': median_time,
+            'p90_time': float(np.percentile(times, 90)),
+            'p95_time': float(np.percentile(times, 95)),
+            'min_time': min(times),
+            'max_time': max(times),
             'audio_duration': result.duration,
-            'realtime_factor': avg_time / result.duration if result.duration > 0 else 0,
+            'realtime_factor': median_time / result.duration if result.duration > 0 else 0,
             'model_name': self.model_name,
             'device': self.device
         }
+    
+    def benchmark_files(self, test_audio_paths: List[Path], num_runs: int = 3,
+                        max_workers: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Benchmark transcription performance over several audio files.
+        
+        On CPU the files are benchmarked in parallel worker processes, each
+        loading its own model and using an equal share of the CPU threads.
+        GPU devices are shared, so files are benchmarked one after another.
+        
+        Args:
+            test_audio_paths: Paths to test audio files
+            num_runs: Number of measured benchmark runs per file
+            max_workers: Maximum worker processes on CPU (default: one per file, up to CPU count)
+            
+        Returns:
+            Dictionary mapping each file path to its benchmark results
+        """
+        if self.device != 'cpu' or len(test_audio_paths) < 2:
+            return {
+                str(path): self.benchmark_transcription(path, num_runs)
+                for path in test_audio_paths
+            }
+        
+        cpu_count = os.cpu_count() or 1
+        workers = max_workers or min(len(test_audio_paths), cpu_count)
+        threads_per_worker = max(1, cpu_count // workers)
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            future_to_path = {
+                executor.submit(
+                    _benchmark_worker, self.model_name, str(self.download_root),
+                    self.quantize, threads_per_worker, str(path), num_runs
+                ): path
+                for path in test_audio_paths
+            }
+            
+            for future in as_completed(future_to_path):
+                results[str(future_to_path[future])] = future.result()
+        
+        return results
+
+
+def _benchmark_worker(model_name: str, download_root: str, quantize: str,
+                      num_threads: int, audio_path: str, num_runs: int) -> Dict[str, float]:
+    """Benchmark one file on CPU inside a worker process."""
+    if TORCH_AVAILABLE:
+        _import_torch().set_num_threads(num_threads)
+    
+    transcriber = WhisperTranscriber(model_name=model_name, device='cpu',
+                                     download_root=download_root, quantize=quantize)
+    try:
+        return transcriber.benchmark_transcription(Path(audio_path), num_runs)
+    finally:
+        transcriber.unload_model()
 
 
 def get_available_models() -> List[str]:
@@ -510,6 +1450,7 @@ if __name__ == "__main__":
     if len(sys.argv) >= 2:
         audio_file = Path(sys.argv[1])
         model_name = sys.argv[2] if len(sys.argv) > 2 else 'medium'
+        output_format = sys.argv[3] if len(sys.argv) > 3 else 'txt'
         
         print(f"Testing transcriber with: {audio_file}")
         print(f"Model: {model_name}")
@@ -526,7 +1467,9 @@ if __name__ == "__main__":
             print(f"\rTranscribing: {progress*100:.1f}%", end='', flush=True)
         
         try:
-            result = transcriber.transcribe(audio_file, progress_callback=progress_callback)
+            # Word-level alignment is only worth its cost for detailed JSON output
+            result = transcriber.transcribe(audio_file, progress_callback=progress_callback,
+                                            word_timestamps=output_format == 'json')
             print(f"\nTranscription completed!")
             print(f"Text: {result.text[:200]}...")
             print(f"Language: {result.language}")
@@ -534,8 +1477,8 @@ if __name__ == "__main__":
             print(f"Processing time: {result.processing_time:.1f}s")
             
             # Save result
-            output_path = audio_file.with_suffix('.txt')
-            transcriber.save_result(result, output_path)
+            output_path = audio_file.with_suffix(f'.{output_format}')
+            transcriber.save_result(result, output_path, format_type=output_format)
             print(f"Result saved to: {output_path}")
             
         except Exception as e:
@@ -543,6 +1486,6 @@ if __name__ == "__main__":
         finally:
             transcriber.unload_model()
     else:
-        print("Usage: python transcriber.py <audio_file> [model_name]")
+        print("Usage: python transcriber.py <audio_file> [model_name] [txt|srt|vtt|json]")
         print(f"Available models: {get_available_models()}")
         print(f"Recommended model: {get_recommended_model()}") 
\ No newline at end of file
@@ -4,135 +4,107 @@ MP4ToText Usage Examples
 Demonstrates various usage patterns and configurations for different platforms.
 """
 
+import contextlib
+import io
+import os
 import sys
 import subprocess
 from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.transcriber import WhisperTranscriber
+
+def suggested_workers(device: str, model: str = "large-v3", vram_gb: float = 0,
+                      cpu_count: int = 1) -> int:
+    """
+    Suggest a worker count for the given hardware.
+    
+    Args:
+        device: 'cuda', 'mps' or 'cpu'
+        model: Whisper model the workers load
+        vram_gb: GPU memory in GB (CUDA only)
+        cpu_count: Number of CPU cores (CPU only)
+    """
+    if device == "cuda":
+        # Budget the model's full memory requirement per worker; throughput
+        # stops improving past about 4 concurrent streams
+        memory_gb = WhisperTranscriber.MODEL_CONFIGS[model]['memory_gb']
+        return max(1, min(4, int(vram_gb // memory_gb)))
+    if device == "cpu":
+        # Workers compete for the same cores; give each one at least 4
+        return max(1, min(2, cpu_count // 4))
+    return 1
+
+
+# Example tables: (description, arguments appended to "python mp4_to_text.py")
+_BASIC_EXAMPLES: Tuple[Tuple[str, str], ...] = (
+    ("Process all videos in a directory", "-i ./input_videos -o ./output_texts"),
+    ("Use specific Whisper model", "-i ./videos -o ./texts -m large-v3"),
+    ("Specify language for better accuracy", "-i ./videos -o ./texts -l zh"),
+    ("Skip already processed files", "-i ./videos -o ./texts --skip-existing"),
+)
+
+_ADVANCED_EXAMPLES: Tuple[Tuple[str, str], ...] = (
+    ("Parallel processing with 2 workers", "-i ./videos -o ./texts -w 2"),
+    ("Force CPU usage (disable GPU)", "-i ./videos -o ./texts -d cpu"),
+    ("Use configuration file", "--config config/my_config.ini"),
+    ("Verbose output for debugging", "-i ./videos -o ./texts --verbose"),
+    ("Quiet mode for scripts", "-i ./videos -o ./texts --quiet"),
+    ("Keep temporary files for inspection", "-i ./videos -o ./texts --no-cleanup"),
+)
+
+_PLATFORM_EXAMPLES: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...] = (
+    ("Windows", (
+        ("Process videos from Desktop",
+         '-i "C:\\Users\\Username\\Desktop\\Videos" -o "C:\\Users\\Username\\Desktop\\Texts"'),
+        ("Use UNC network path", '-i "\\\\server\\videos" -o "\\\\server\\texts"'),
+    )),
+    ("macOS", (
+        ("Process videos from Downloads", "-i ~/Downloads/Videos -o ~/Documents/Transcripts"),
+        ("Use Apple Silicon GPU (MPS)", "-i ./videos -o ./texts -d mps"),
+    )),
+    ("Linux", (
+        ("Process videos from home directory", "-i /home/user/Videos -o /home/user/Transcripts"),
+        ("Use CUDA GPU", "-i ./videos -o ./texts -d cuda"),
+    )),
+)
+
+_TROUBLESHOOTING_COMMANDS: Tuple[Tuple[str, str], ...] = (
+    ("Check system information", "--system-info"),
+    ("List available models", "--list-models"),
+    ("Test with tiny model first", "-i ./test_video -o ./test_output -m tiny -v"),
+    ("Force CPU if GPU issues", "-i ./videos -o ./texts -d cpu"),
+    ("Run with verbose logging", "-i ./videos -o ./texts -v"),
+)
+
 
 class UsageExamples:
     """Collection of usage examples for MP4ToText."""
     
     def __init__(self):
         self.script_name = "mp4_to_text.py"
+        self._prefix = f"python {self.script_name}"
         
     def basic_usage(self):
         """Basic usage examples."""
-        print("=== Basic Usage Examples ===\n")
-        
-        examples = [
-            {
-                "description": "Process all videos in a directory",
-                "command": f"python {self.script_name} -i ./input_videos -o ./output_texts"
-            },
-            {
-                "description": "Use specific Whisper model",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -m large-v3"
-            },
-            {
-                "description": "Specify language for better accuracy",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -l zh"
-            },
-            {
-                "description": "Skip already processed files",
-                "command": f"python {self.script_name} -i ./videos -o ./texts --skip-existing"
-            }
-        ]
-        
-        for example in examples:
-            print(f"• {example['description']}:")
-            print(f"  {example['command']}\n")
+        parts = [f"• {desc}:\n  {self._prefix} {args}\n\n" for desc, args in _BASIC_EXAMPLES]
+        sys.stdout.write("=== Basic Usage Examples ===\n\n" + "".join(parts))
     
     def advanced_usage(self):
         """Advanced usage examples."""
-        print("=== Advanced Usage Examples ===\n")
-        
-        examples = [
-            {
-                "description": "Parallel processing with 2 workers",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -w 2"
-            },
-            {
-                "description": "Force CPU usage (disable GPU)",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -d cpu"
-            },
-            {
-                "description": "Use configuration file",
-                "command": f"python {self.script_name} --config config/my_config.ini"
-            },
-            {
-                "description": "Verbose output for debugging",
-                "command": f"python {self.script_name} -i ./videos -o ./texts --verbose"
-            },
-            {
-                "description": "Quiet mode for scripts",
-                "command": f"python {self.script_name} -i ./videos -o ./texts --quiet"
-            },
-            {
-                "description": "Keep temporary files for inspection",
-                "command": f"python {self.script_name} -i ./videos -o ./texts --no-cleanup"
-            }
-        ]
-        
-        for example in examples:
-            print(f"• {example['description']}:")
-            print(f"  {example['command']}\n")
+        parts = [f"• {desc}:\n  {self._prefix} {args}\n\n" for desc, args in _ADVANCED_EXAMPLES]
+        sys.stdout.write("=== Advanced Usage Examples ===\n\n" + "".join(parts))
     
     def platform_specific_examples(self):
         """Platform-specific usage examples."""
-        print("=== Platform-Specific Examples ===\n")
-        
-        # Windows examples
-        print("Windows:")
-        windows_examples = [
-            {
-                "description": "Process videos from Desktop",
-                "command": f'python {self.script_name} -i "C:\\Users\\Username\\Desktop\\Videos" -o "C:\\Users\\Username\\Desktop\\Texts"'
-            },
-            {
-                "description": "Use UNC network path",
-                "command": f'python {self.script_name} -i "\\\\server\\videos" -o "\\\\server\\texts"'
-            }
-        ]
-        
-        for example in windows_examples:
-            print(f"  • {example['description']}:")
-            print(f"    {example['command']}")
-        print()
-        
-        # macOS examples
-        print("macOS:")
-        macos_examples = [
-            {
-                "description": "Process videos from Downloads",
-                "command": f"python {self.script_name} -i ~/Downloads/Videos -o ~/Documents/Transcripts"
-            },
-            {
-                "description": "Use Apple Silicon GPU (MPS)",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -d mps"
-            }
-        ]
-        
-        for example in macos_examples:
-            print(f"  • {example['description']}:")
-            print(f"    {example['command']}")
-        print()
-        
-        # Linux examples
-        print("Linux:")
-        linux_examples = [
-            {
-                "description": "Process videos from home directory",
-                "command": f"python {self.script_name} -i /home/user/Videos -o /home/user/Transcripts"
-            },
-            {
-                "description": "Use CUDA GPU",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -d cuda"
-            }
-        ]
-        
-        for example in linux_examples:
-            print(f"  • {example['description']}:")
-            print(f"    {example['command']}")
-        print()
+        parts = ["=== Platform-Specific Examples ===\n\n"]
+        for platform_name, platform_examples in _PLATFORM_EXAMPLES:
+            parts.append(f"{platform_name}:\n")
+            parts.extend(f"  • {desc}:\n    {self._prefix} {args}\n" for desc, args in platform_examples)
+            parts.append("\n")
+        sys.stdout.write("".join(parts))
     
     def batch_processing_examples(self):
         """Batch processing examples."""
@@ -206,43 +178,43 @@ level = WARNING
 console_output = true'''
         print(lowres_config)
         print()
+        
+        print("Parsing a configuration once per batch (Python):")
+        cached_config = '''import functools
+import os
+
+from core import ConfigManager
+
+@functools.lru_cache(maxsize=8)
+def _load_config(path, mtime_ns):
+    return ConfigManager(config_file=path)
+
+def get_config(path="config_performance.ini"):
+    # Keyed on path + modification time: the INI file is parsed once per
+    # process instead of once per video, and edits are still picked up.
+    # Treat the returned object as read-only, it is shared by all callers.
+    return _load_config(path, os.stat(path).st_mtime_ns)
+
+for video_path in video_files:
+    config = get_config()
+    ...'''
+        print(cached_config)
+        print()
     
     def troubleshooting_commands(self):
         """Troubleshooting and diagnostic commands."""
-        print("=== Troubleshooting Commands ===\n")
-        
-        commands = [
-            {
-                "description": "Check system information",
-                "command": f"python {self.script_name} --system-info"
-            },
-            {
-                "description": "List available models",
-                "command": f"python {self.script_name} --list-models"
-            },
-            {
-                "description": "Test with tiny model first",
-                "command": f"python {self.script_name} -i ./test_video -o ./test_output -m tiny -v"
-            },
-            {
-                "description": "Force CPU if GPU issues",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -d cpu"
-            },
-            {
-                "description": "Run with verbose logging",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -v"
-            }
-        ]
-        
-        for cmd in commands:
-            print(f"• {cmd['description']}:")
-            print(f"  {cmd['command']}\n")
+        parts = [f"• {desc}:\n  {self._prefix} {args}\n\n" for desc, args in _TROUBLESHOOTING_COMMANDS]
+        sys.stdout.write("=== Troubleshooting Commands ===\n\n" + "".join(parts))
     
     def python_api_examples(self):
         """Python API usage examples."""
         print("=== Python API Examples ===\n")
         
         api_example = '''# Import the modules
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
 from core import ConfigManager, FileManager, AudioProcessor, WhisperTranscriber
 
 # Create configuration
@@ -251,65 +223,241 @@ config.processing_config.input_dir = "./videos"
 config.processing_config.output_dir = "./texts"
 config.processing_config.model_name = "medium"
 
-# Initialize components
+# Initialize shared components
 file_manager = FileManager(config.processing_config.input_dir, 
                           config.processing_config.output_dir)
 audio_processor = AudioProcessor("./temp")
-transcriber = WhisperTranscriber(config.processing_config.model_name)
 
-# Process a single file
-video_path = Path("./test_video.mp4")
-audio_path = audio_processor.extract_audio(video_path)
-result = transcriber.transcribe(audio_path)
-output_path = file_manager.get_output_path(video_path)
-transcriber.save_result(result, output_path)
+# Number of workers. Each worker loads its own model, so on a GPU this is
+# bounded by VRAM (about 3 medium models on a 16GB card). Use 1 when the
+# videos are on a spinning disk: parallel reads only make the drive thrash.
+num_workers = 2
+
+# One transcriber per worker thread - a loaded model must not be shared
+# between concurrent transcriptions
+worker_state = threading.local()
+
+def get_transcriber():
+    if not hasattr(worker_state, "transcriber"):
+        worker_state.transcriber = WhisperTranscriber(config.processing_config.model_name)
+    return worker_state.transcriber
+
+def process_video(video_path):
+    audio_path = audio_processor.extract_audio(video_path)
+    try:
+        transcriber = get_transcriber()
+        result = transcriber.transcribe(audio_path)
+        output_path = file_manager.get_output_path(video_path)
+        transcriber.save_result(result, output_path)
+        return output_path
+    finally:
+        audio_processor.cleanup_temp_audio(audio_path)
 
-print(f"Transcription saved to: {output_path}")'''
+# Fan out over all videos and report each one as it finishes
+videos = sorted(Path(config.processing_config.input_dir).glob("*.mp4"))
+with ThreadPoolExecutor(max_workers=num_workers) as executor:
+    futures = {executor.submit(process_video, video): video for video in videos}
+    for done, future in enumerate(as_completed(futures), 1):
+        video = futures[future]
+        try:
+            print(f"[{done}/{len(videos)}] {video.name} -> {future.result()}")
+        except Exception as e:
+            print(f"[{done}/{len(videos)}] {video.name} failed: {e}")'''
         
         print(api_example)
         print()
+        
+        print("Skipping finished videos with one directory listing:")
+        skip_example = '''import os
+from pathlib import Path
+
+# Read the output directory once and build a set of finished names,
+# instead of checking Path.exists() for every candidate video
+with os.scandir("./texts") as entries:
+    finished = {Path(e.name).stem for e in entries if e.name.endswith(".txt")}
+
+videos = [v for v in Path("./videos").glob("*.mp4") if v.stem not in finished]'''
+        
+        print(skip_example)
+        print()
+        
+        print("Transcribing one long recording in parallel chunks:")
+        chunk_example = '''import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core import AudioProcessor, WhisperTranscriber
+
+audio_processor = AudioProcessor("./temp")
+audio_path = audio_processor.extract_audio(Path("./long.mp4"))
+
+# Cut the extracted WAV into 180s pieces without re-encoding
+chunk_dir = Path("./temp/chunks")
+chunk_dir.mkdir(parents=True, exist_ok=True)
+subprocess.run(["ffmpeg", "-i", str(audio_path), "-f", "segment", "-segment_time", "180",
+                "-c", "copy", str(chunk_dir / "chunk_%04d.wav")], check=True)
+chunks = sorted(chunk_dir.glob("chunk_*.wav"))
+
+worker_state = threading.local()
+
+def transcribe_chunk(chunk_path):
+    if not hasattr(worker_state, "transcriber"):
+        worker_state.transcriber = WhisperTranscriber("medium", device="cuda")
+    return worker_state.transcriber.transcribe(chunk_path).text
+
+# map() yields results in input order, so the pieces join back directly.
+# Fixed-length cuts can split a word; cutting at silences (found with
+# ffmpeg's silencedetect filter) avoids that.
+with ThreadPoolExecutor(max_workers=4) as executor:
+    text = " ".join(executor.map(transcribe_chunk, chunks))'''
+        
+        print(chunk_example)
+        print()
+        
+        print("Overlapping FFmpeg extraction with transcription (asyncio):")
+        async_example = '''import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core import WhisperTranscriber
+
+EXTRACT_TASKS = 5   # concurrent ffmpeg subprocesses
+GPU_STREAMS = 4     # concurrent transcriptions, one model each
+
+worker_state = threading.local()
+gpu_pool = ThreadPoolExecutor(max_workers=GPU_STREAMS)
+
+def transcribe(audio_path):
+    if not hasattr(worker_state, "transcriber"):
+        worker_state.transcriber = WhisperTranscriber("medium", device="cuda")
+    return worker_state.transcriber.transcribe(audio_path)
+
+async def process(video_path, extract_limit, output_dir):
+    audio_path = Path("./temp") / f"{video_path.stem}.wav"
+    async with extract_limit:
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-i", str(video_path), "-vn", "-acodec", "pcm_s16le",
+            "-ar", "16000", "-ac", "1", str(audio_path),
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+        if await proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed for {video_path}")
+    
+    # The event loop keeps extracting other files while this one transcribes
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(gpu_pool, transcribe, audio_path)
+    (output_dir / f"{video_path.stem}.txt").write_text(result.text, encoding="utf-8")
+
+async def main(videos, output_dir):
+    extract_limit = asyncio.Semaphore(EXTRACT_TASKS)
+    await asyncio.gather(*[process(v, extract_limit, output_dir) for v in videos])
+
+# One process drives EXTRACT_TASKS tasks; to scale further, run several
+# such processes (total concurrency = processes x tasks per process).
+Path("./temp").mkdir(exist_ok=True)
+asyncio.run(main(sorted(Path("./videos").glob("*.mp4")), Path("./texts")))'''
+        
+        print(async_example)
+        print()
+        
+        print("Preferring the GPU with a CPU fallback:")
+        fallback_example = '''from pathlib import Path
+
+from core import WhisperTranscriber
+
+# load_model() already retries on the CPU when the GPU load fails; this
+# also survives CUDA running out of memory partway through a batch
+transcriber = WhisperTranscriber("large-v3", device="cuda")
+transcriber.load_model()
+
+def transcribe_with_fallback(audio_path):
+    global transcriber
+    result = transcriber.transcribe(audio_path)
+    # transcribe() reports errors such as CUDA out-of-memory as an empty
+    # result, so retry those on a small CPU model instead of losing the file
+    if result.text or transcriber.device == "cpu":
+        return result
+    print("GPU transcription failed, switching to tiny on CPU")
+    transcriber.unload_model()
+    transcriber = WhisperTranscriber("tiny", device="cpu")
+    transcriber.load_model()
+    return transcriber.transcribe(audio_path)
+
+for audio_path in [Path("./temp/a.wav"), Path("./temp/b.wav")]:
+    result = transcribe_with_fallback(audio_path)'''
+        
+        print(fallback_example)
+        print()
     
     def performance_optimization(self):
         """Performance optimization examples."""
-        print("=== Performance Optimization ===\n")
+        cpu_count = os.cpu_count() or 1
+        gpu_model = "large-v3"
+        gpu_memory_gb = WhisperTranscriber.MODEL_CONFIGS[gpu_model]['memory_gb']
+        gpu_workers = suggested_workers("cuda", model=gpu_model, vram_gb=24)
+        mps_workers = suggested_workers("mps")
+        cpu_workers = suggested_workers("cpu", cpu_count=cpu_count)
         
         optimizations = [
             {
-                "scenario": "High-end system with NVIDIA GPU",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -m large-v3 -d cuda -w 1"
+                "scenario": "High-end system with NVIDIA GPU (24GB VRAM)",
+                "command": f"{self._prefix} -i ./videos -o ./texts -m {gpu_model} -d cuda -w {gpu_workers}",
+                "note": f"one model per worker in VRAM (~{gpu_memory_gb}GB each); throughput plateaus beyond 4 streams"
             },
             {
                 "scenario": "Apple Silicon Mac",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -m large -d mps -w 1"
+                "command": f"{self._prefix} -i ./videos -o ./texts -m large -d mps -w {mps_workers}",
+                "note": "MPS does not benefit from concurrent models sharing the GPU"
             },
             {
                 "scenario": "Multi-core CPU system",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -m medium -d cpu -w 3"
+                "command": f"{self._prefix} -i ./videos -o ./texts -m medium -d cpu -w {cpu_workers}",
+                "note": f"sized for this machine's {cpu_count} CPU(s); each worker needs ~4 cores"
             },
             {
                 "scenario": "Low-memory system",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -m small -d cpu -w 1"
+                "command": f"{self._prefix} -i ./videos -o ./texts -m small -d cpu -w 1"
             },
             {
                 "scenario": "Quick testing",
-                "command": f"python {self.script_name} -i ./videos -o ./texts -m tiny -w 1"
+                "command": f"{self._prefix} -i ./videos -o ./texts -m tiny -w 1"
             }
         ]
         
-        for opt in optimizations:
-            print(f"• {opt['scenario']}:")
-            print(f"  {opt['command']}\n")
+        parts = [
+            f"• {o['scenario']}:\n  {o['command']}\n" + (f"  # {o['note']}\n" if 'note' in o else "") + "\n"
+            for o in optimizations
+        ]
+        sys.stdout.write("=== Performance Optimization ===\n\n" + "".join(parts))
     
     def show_all_examples(self):
         """Show all examples."""
-        self.basic_usage()
-        self.advanced_usage()
-        self.platform_specific_examples()
-        self.batch_processing_examples()
-        self.configuration_examples()
-        self.troubleshooting_commands()
-        self.python_api_examples()
-        self.performance_optimization()
+        # Collect every section first so the terminal receives a single write
+        with io.StringIO() as buffer:
+            with contextlib.redirect_stdout(buffer):
+                self.basic_usage()
+                self.advanced_usage()
+                self.platform_specific_examples()
+                self.batch_processing_examples()
+                self.configuration_examples()
+                self.troubleshooting_commands()
+                self.python_api_examples()
+                self.performance_optimization()
+            sys.stdout.write(buffer.getvalue())
+
+
+# Example type name -> section printer, shared by main() and its help text
+_DISPATCH: Dict[str, Callable[[UsageExamples], None]] = {
+    "basic": UsageExamples.basic_usage,
+    "advanced": UsageExamples.advanced_usage,
+    "platform": UsageExamples.platform_specific_examples,
+    "batch": UsageExamples.batch_processing_examples,
+    "config": UsageExamples.configuration_examples,
+    "troubleshooting": UsageExamples.troubleshooting_commands,
+    "api": UsageExamples.python_api_examples,
+    "performance": UsageExamples.performance_optimization,
+}
 
 
 def main():
@@ -318,26 +466,13 @@ def main():
     
     if len(sys.argv) > 1:
         example_type = sys.argv[1].lower()
+        handler = _DISPATCH.get(example_type)
         
-        if example_type == "basic":
-            examples.basic_usage()
-        elif example_type == "advanced":
-            examples.advanced_usage()
-        elif example_type == "platform":
-            examples.platform_specific_examples()
-        elif example_type == "batch":
-            examples.batch_processing_examples()
-        elif example_type == "config":
-            examples.configuration_examples()
-        elif example_type == "troubleshooting":
-            examples.troubleshooting_commands()
-        elif example_type == "api":
-            examples.python_api_examples()
-        elif example_type == "performance":
-            examples.performance_optimization()
+        if handler:
+            handler(examples)
         else:
             print(f"Unknown example type: {example_type}")
-            print("Available types: basic, advanced, platform, batch, config, troubleshooting, api, performance")
+            print(f"Available types: {', '.join(_DISPATCH)}")
     else:
         examples.show_all_examples()
 
@@ -9,14 +9,22 @@ Author: Video2Text Team
 License: MIT
 """
 
+import os
 import sys
 import argparse
+import atexit
 import logging
+import logging.handlers
+import multiprocessing
 import time
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
-from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
 import signal
+import threading
 
 try:
     from tqdm import tqdm
@@ -54,15 +62,55 @@ try:
         WhisperTranscriber, 
         PlatformUtils
     )
+    from core.config_manager import ProcessingConfig, AudioConfig
+    from core.transcriber import (
+        TranscriptionResult, TRANSFORMERS_AVAILABLE, TORCH_AVAILABLE, _DATACLASS_SLOTS, _import_torch,
+        _supports_assign
+    )
 except ImportError as e:
     print(f"Error: Failed to import core modules: {e}")
     print("Please ensure all dependencies are installed and core modules are available.")
     sys.exit(1)
 
 
+@dataclass(**_DATACLASS_SLOTS)
+class _HotCfg:
+    """Processing settings read for every file, snapshotted from ProcessingConfig."""
+    quiet: bool
+    language: str
+    chunk_threshold: float
+    model_name: str
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ProcessingStats:
+    """Counters for a processing run, updated once or more per file."""
+    total_files: int = 0
+    processed: int = 0
+    successful: int = 0
+    failed: int = 0
+    skipped: int = 0
+    total_duration: float = 0.0
+    total_processing_time: float = 0.0
+    start_time: float = 0.0
+    
+    def merge(self, delta: 'ProcessingStats'):
+        """Add the per-file counters reported by a pool worker."""
+        self.processed += delta.processed
+        self.successful += delta.successful
+        self.failed += delta.failed
+        self.skipped += delta.skipped
+        self.total_duration += delta.total_duration
+        self.total_processing_time += delta.total_processing_time
+
+
 class MP4ToTextProcessor:
     """Main processor for MP4 to text conversion."""
     
+    # Files whose audio is extracted ahead of the one being transcribed. Each
+    # holds its decoded samples in memory (about 230 MB per hour of audio).
+    EXTRACT_AHEAD = 2
+    
     def __init__(self, config_manager: ConfigManager, move_to_done: bool = False, done_dir: str = None):
         self.config = config_manager
         self.platform_utils = PlatformUtils()
@@ -80,36 +128,74 @@ class MP4ToTextProcessor:
             audio_config=self.config.audio_config.__dict__
         )
         
-        self.transcriber = WhisperTranscriber(
-            model_name=self.config.processing_config.model_name,
-            device=self.config.get_effective_device()
-        )
+        # Settings the per-file path reads, bound once instead of via
+        # self.config.processing_config on every access
+        self._hot = _HotCfg(**{
+            field.name: getattr(self.config.processing_config, field.name)
+            for field in fields(_HotCfg)
+        })
+        
+        # Created on first use: pool workers and batched runs never need the
+        # parent's transcriber, and its construction imports the backend
+        self._transcriber: Optional[WhisperTranscriber] = None
         
         # Processing statistics
-        self.stats = {
-            'total_files': 0,
-            'processed': 0,
-            'successful': 0,
-            'failed': 0,
-            'skipped': 0,
-            'total_duration': 0.0,
-            'total_processing_time': 0.0,
-            'start_time': 0.0
-        }
+        self.stats = ProcessingStats()
+        
+        # Per-file progress goes through logging so console writes happen on
+        # the listener thread configured by setup_logging()
+        self.log = logging.getLogger('mp4_to_text')
+        
+        # Shared flag that tells pool workers to stop (set while a pool runs)
+        self._worker_stop = None
+        
+        # Set by the signal handler; checked between stages and from the
+        # transcription progress callback
+        self._shutdown = threading.Event()
         
         # Setup signal handlers for graceful shutdown
         self._setup_signal_handlers()
-        self._shutdown_requested = False
+    
+    @property
+    def _shutdown_requested(self) -> bool:
+        """Whether a shutdown has been requested."""
+        return self._shutdown.is_set()
+    
+    @property
+    def transcriber(self) -> WhisperTranscriber:
+        """Transcriber for this processor; the model itself loads on first use."""
+        if self._transcriber is None:
+            self._transcriber = WhisperTranscriber(
+                model_name=self.config.processing_config.model_name,
+                device=self.config.get_effective_device(),
+                dtype=self.config.processing_config.dtype,
+                attn_impl=self.config.processing_config.attn_impl,
+                quantize=self.config.processing_config.quantize,
+                backend=self.config.processing_config.backend,
+                model_cache=self.config.processing_config.model_cache
+            )
+        return self._transcriber
+    
+    def release_model(self):
+        """Unload the model if one was created."""
+        if self._transcriber is not None:
+            self._transcriber.unload_model()
     
     def _setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown."""
         def signal_handler(signum, frame):
-            print(f"\n{Colors.YELLOW}Shutdown requested. Finishing current task...{Colors.END}")
-            self._shutdown_requested = True
+            print(f"\n{Colors.YELLOW}Shutdown requested. Stopping current task...{Colors.END}")
+            self._shutdown.set()
+            if self._worker_stop is not None:
+                self._worker_stop.value = 1
         
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
     
+    def _mark_processed(self, video_path: Path, **record):
+        """Record the outcome of a file in the processing history."""
+        self.file_manager.mark_processed(video_path, **record)
+    
     def _print_header(self):
         """Print application header."""
         print(f"{Colors.CYAN}{Colors.BOLD}")
@@ -158,11 +244,11 @@ class MP4ToTextProcessor:
         print(f"{Colors.GREEN}✓ Setup validation successful{Colors.END}")
         return True
     
-    def _load_whisper_model(self) -> bool:
+    def _load_whisper_model(self, compile_model: bool = True) -> bool:
         """Load Whisper model with progress indication."""
         print(f"{Colors.BLUE}Loading Whisper model...{Colors.END}")
         
-        if not self.transcriber.load_model():
+        if not self.transcriber.load_model(compile_model=compile_model):
             print(f"{Colors.RED}✗ Failed to load Whisper model{Colors.END}")
             return False
         
@@ -178,15 +264,18 @@ class MP4ToTextProcessor:
         # Filter out already processed files if requested
         if self.config.processing_config.skip_existing:
             original_count = len(video_files)
+            # One directory scan instead of two stat() calls per video
+            processed = self.file_manager.build_processed_index()
             video_files = [
                 video for video in video_files 
-                if not self.file_manager.is_processed(video, skip_existing=True)
+                if not self.file_manager.is_processed(video, skip_existing=True,
+                                                      processed_index=processed)
             ]
             skipped = original_count - len(video_files)
             if skipped > 0:
                 print(f"{Colors.YELLOW}Skipping {skipped} already processed files{Colors.END}")
         
-        self.stats['total_files'] = len(video_files)
+        self.stats.total_files = len(video_files)
         
         if not video_files:
             print(f"{Colors.YELLOW}No video files to process{Colors.END}")
@@ -195,12 +284,36 @@ class MP4ToTextProcessor:
         print(f"{Colors.GREEN}Found {len(video_files)} video files to process{Colors.END}")
         return video_files
     
-    def process_single_file(self, video_path: Path) -> bool:
+    def _extract_stage(self, video_path: Path) -> Tuple[Optional['np.ndarray'], Dict[str, Any], str]:
+        """
+        Validate a video file, read its metadata and decode its audio in memory.
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            Tuple of (audio, video_info, validation_error); audio is None
+            when validation failed
+        """
+        is_valid, error_msg = self.audio_processor.validate_video_file(video_path)
+        if not is_valid:
+            return None, {}, error_msg
+        
+        video_info = self.audio_processor.get_video_info(video_path)
+        if not video_info.get('has_audio', False):
+            raise ValueError(f"No audio stream found in video: {video_path}")
+        
+        audio = self.audio_processor.stream_pcm(video_path, duration=video_info.get('duration', 0.0))
+        return audio, video_info, ""
+    
+    def process_single_file(self, video_path: Path, extraction: Optional[Future] = None) -> bool:
         """
         Process a single video file.
         
         Args:
             video_path: Path to video file
+            extraction: Pending result of _extract_stage for this file, if
+                its audio is already being extracted in the background
             
         Returns:
             True if successful, False otherwise
@@ -212,144 +325,193 @@ class MP4ToTextProcessor:
         video_duration = 0.0
         
         try:
-            # Validate video file
-            is_valid, error_msg = self.audio_processor.validate_video_file(video_path)
-            if not is_valid:
-                print(f"{Colors.RED}✗ Validation failed: {error_msg}{Colors.END}")
-                self.file_manager.mark_processed(
+            if not self._hot.quiet:
+                self.log.info(f"Processing: {video_path.name}", extra={'color': Colors.CYAN})
+            
+            # Validate video file and extract audio
+            if extraction is None:
+                if not self._hot.quiet:
+                    self.log.info("  Extracting audio...")
+                audio, video_info, error_msg = self._extract_stage(video_path)
+            else:
+                audio, video_info, error_msg = extraction.result()
+            
+            if audio is None:
+                self.log.error(f"✗ Validation failed: {error_msg}")
+                self._mark_processed(
                     video_path, success=False, error=error_msg
                 )
                 return False
             
-            # Get video info
-            video_info = self.audio_processor.get_video_info(video_path)
             video_duration = video_info.get('duration', 0.0)
             
-            if not self.config.processing_config.quiet:
-                print(f"{Colors.CYAN}Processing: {video_path.name}{Colors.END}")
-                print(f"  Duration: {video_duration:.1f}s")
-            
-            # Extract audio
-            if not self.config.processing_config.quiet:
-                print("  Extracting audio...")
-            
-            def audio_progress(progress):
-                if not self.config.processing_config.quiet and TQDM_AVAILABLE:
-                    pass  # tqdm progress bar handles this
-            
-            audio_path = self.audio_processor.extract_audio(
-                video_path, 
-                progress_callback=audio_progress
-            )
+            if not self._hot.quiet:
+                self.log.info(f"  Duration: {video_duration:.1f}s")
             
             if self._shutdown_requested:
-                self.audio_processor.cleanup_temp_audio(audio_path)
                 return False
             
             # Transcribe audio
-            if not self.config.processing_config.quiet:
-                print("  Transcribing audio...")
+            if not self._hot.quiet:
+                self.log.info("  Transcribing audio...")
             
             def transcribe_progress(progress):
-                if not self.config.processing_config.quiet and TQDM_AVAILABLE:
-                    pass  # tqdm progress bar handles this
-            
-            result = self.transcriber.transcribe(
-                audio_path,
-                language=self.config.processing_config.language,
-                progress_callback=transcribe_progress
-            )
+                # Abandon the file mid-transcription instead of finishing it.
+                # Only faster-whisper and chunked decoding report progress
+                # while decoding; at 1.0 the transcript is done, so keep it.
+                if self._shutdown_requested and progress < 1.0:
+                    raise KeyboardInterrupt
             
-            if not result.text.strip():
-                error_msg = "No text extracted from audio"
-                print(f"{Colors.YELLOW}⚠ Warning: {error_msg}{Colors.END}")
-                self.file_manager.mark_processed(
-                    video_path, success=False, error=error_msg,
-                    duration=video_duration, processing_time=time.time() - start_time,
-                    model_used=self.config.processing_config.model_name
+            # Long recordings on GPU: decode 30 s chunks side by side
+            chunk_threshold = self._hot.chunk_threshold
+            if (0 < chunk_threshold < video_duration
+                    and self.transcriber.backend == 'openai'
+                    and self.transcriber.device != 'cpu'):
+                chunks, offsets = self.audio_processor.split_chunks(audio, chunk_len=30.0, overlap=1.0)
+                result = self.transcriber.transcribe_chunks(
+                    chunks, offsets,
+                    language=self._hot.language,
+                    progress_callback=transcribe_progress
+                )
+            else:
+                result = self.transcriber.transcribe(
+                    audio,
+                    language=self._hot.language,
+                    progress_callback=transcribe_progress
                 )
-                self.audio_processor.cleanup_temp_audio(audio_path)
-                return False
-            
-            # Save result
-            output_path = self.file_manager.get_output_path(video_path)
-            self.transcriber.save_result(result, output_path)
-            
-            # Clean up temp file
-            if self.config.processing_config.cleanup_temp:
-                self.audio_processor.cleanup_temp_audio(audio_path)
-            
-            # Record success
-            processing_time = time.time() - start_time
-            self.file_manager.mark_processed(
-                video_path, success=True,
-                duration=video_duration, processing_time=processing_time,
-                model_used=self.config.processing_config.model_name
-            )
-            
-            # Update statistics
-            self.stats['successful'] += 1
-            self.stats['total_duration'] += video_duration
-            self.stats['total_processing_time'] += processing_time
-            
-            # Move processed file to done directory if configured
-            if self.move_to_done and self.done_dir:
-                if not self.config.processing_config.quiet:
-                    print(f"  Moving processed file...")
-                self.file_manager.move_processed_file(video_path, self.done_dir)
             
-            if not self.config.processing_config.quiet:
-                realtime_factor = processing_time / video_duration if video_duration > 0 else 0
-                print(f"{Colors.GREEN}✓ Completed in {processing_time:.1f}s "
-                      f"(RTF: {realtime_factor:.2f}){Colors.END}")
-                print(f"  Output: {output_path}")
-                print(f"  Text length: {len(result.text)} characters")
-                if result.language != 'auto':
-                    print(f"  Detected language: {result.language}")
-                print()
-            
-            return True
+            return self._finish_file(video_path, video_duration, result, time.time() - start_time)
             
+        except KeyboardInterrupt:
+            # Interrupted by shutdown; not a failure, so nothing is recorded
+            self.log.warning(f"Interrupted: {video_path.name}")
+            return False
+        
         except Exception as e:
-            error_msg = str(e)
-            print(f"{Colors.RED}✗ Error processing {video_path.name}: {error_msg}{Colors.END}")
+            self._record_failure(video_path, str(e), video_duration, time.time() - start_time)
+            return False
+        
+        finally:
+            self.stats.processed += 1
+    
+    def _finish_file(self, video_path: Path, video_duration: float,
+                     result: TranscriptionResult, processing_time: float) -> bool:
+        """
+        Save a transcription result and record the outcome.
+        
+        Args:
+            video_path: Path to video file
+            video_duration: Video duration in seconds
+            result: TranscriptionResult for the file
+            processing_time: Seconds spent on the file
             
-            # Record failure
-            self.file_manager.mark_processed(
+        Returns:
+            True if text was extracted and saved, False otherwise
+        """
+        if not result.text.strip():
+            error_msg = "No text extracted from audio"
+            self.log.warning(f"⚠ Warning: {error_msg}")
+            self._mark_processed(
                 video_path, success=False, error=error_msg,
-                duration=video_duration, processing_time=time.time() - start_time,
-                model_used=self.config.processing_config.model_name
+                duration=video_duration, processing_time=processing_time,
+                model_used=self._hot.model_name
             )
-            
-            self.stats['failed'] += 1
             return False
         
-        finally:
-            self.stats['processed'] += 1
+        # Save result
+        output_path = self.file_manager.get_output_path(video_path)
+        self.transcriber.save_result(result, output_path)
+        
+        # Record success
+        self._mark_processed(
+            video_path, success=True,
+            duration=video_duration, processing_time=processing_time,
+            model_used=self._hot.model_name
+        )
+        
+        # Update statistics
+        self.stats.successful += 1
+        self.stats.total_duration += video_duration
+        self.stats.total_processing_time += processing_time
+        
+        # Move processed file to done directory if configured
+        if self.move_to_done and self.done_dir:
+            if not self._hot.quiet:
+                self.log.info("  Moving processed file...")
+            self.file_manager.move_processed_file(video_path, self.done_dir)
+        
+        if not self._hot.quiet:
+            realtime_factor = processing_time / video_duration if video_duration > 0 else 0
+            self.log.info(f"✓ Completed in {processing_time:.1f}s (RTF: {realtime_factor:.2f})",
+                          extra={'color': Colors.GREEN})
+            self.log.info(f"  Output: {output_path}")
+            self.log.info(f"  Text length: {len(result.text)} characters")
+            if result.language != 'auto':
+                self.log.info(f"  Detected language: {result.language}")
+        
+        return True
+    
+    def _record_failure(self, video_path: Path, error_msg: str,
+                        video_duration: float = 0.0, processing_time: float = 0.0):
+        """Report and record a file that failed with an error."""
+        self.log.error(f"✗ Error processing {video_path.name}: {error_msg}")
+        
+        self._mark_processed(
+            video_path, success=False, error=error_msg,
+            duration=video_duration, processing_time=processing_time,
+            model_used=self._hot.model_name
+        )
+        
+        self.stats.failed += 1
+    
+    def _discard_extractions(self, futures):
+        """Cancel audio decoding for files that will not be transcribed."""
+        for future in futures:
+            future.cancel()
     
     def process_batch(self) -> bool:
         """Process all video files in batch."""
         if not self._validate_setup():
             return False
         
-        if not self._load_whisper_model():
-            return False
-        
         video_files = self._get_video_files()
         if not video_files:
             return True
         
-        self.stats['start_time'] = time.time()
+        # Batched GPU inference runs through the transformers pipeline, so only
+        # that backend has it; the others decode one file at a time
+        batched = (self.config.processing_config.batch_size > 1
+                   and self.config.get_effective_device() != 'cpu')
+        if batched and self.config.processing_config.backend != 'transformers':
+            print(f"{Colors.YELLOW}Batch size {self.config.processing_config.batch_size} needs "
+                  f"--backend transformers; processing files one at a time{Colors.END}")
+            batched = False
+        if batched and not TRANSFORMERS_AVAILABLE:
+            print(f"{Colors.YELLOW}Batched inference needs transformers (pip install transformers); "
+                  f"processing files one at a time{Colors.END}")
+            batched = False
+        
+        # Pool workers load their own model; only the sequential path uses this one
+        concurrent = (not batched and self.config.processing_config.max_workers > 1
+                      and len(video_files) > 1)
+        if not batched and not concurrent and not self._load_whisper_model():
+            return False
+        
+        self.stats.start_time = time.time()
         
         # Print processing plan
         print(f"{Colors.BLUE}Processing Plan:{Colors.END}")
         print(f"  Files to process: {len(video_files)}")
         print(f"  Max workers: {self.config.processing_config.max_workers}")
+        if batched:
+            print(f"  Batch size: {self.config.processing_config.batch_size}")
         print(f"  Skip existing: {self.config.processing_config.skip_existing}")
         print()
         
         # Process files
-        if self.config.processing_config.max_workers > 1:
+        if batched:
+            success = self._process_batched(video_files)
+        elif concurrent:
             success = self._process_concurrent(video_files)
         else:
             success = self._process_sequential(video_files)
@@ -364,59 +526,247 @@ class MP4ToTextProcessor:
         return success
     
     def _process_sequential(self, video_files: List[Path]) -> bool:
-        """Process files sequentially."""
+        """
+        Process files one at a time, extracting audio for the next files in
+        the background so FFmpeg runs while the current file is transcribed.
+        """
+        progress_files = video_files
         if TQDM_AVAILABLE and not self.config.processing_config.quiet:
-            video_files = tqdm(video_files, desc="Processing videos", unit="file")
+            progress_files = tqdm(video_files, desc="Processing videos", unit="file")
         
-        for video_path in video_files:
-            if self._shutdown_requested:
-                print(f"{Colors.YELLOW}Processing interrupted by user{Colors.END}")
-                break
+        # index -> Future of _extract_stage; transcription stays on this thread
+        pending: Dict[int, Future] = {}
+        
+        with ThreadPoolExecutor(max_workers=self.EXTRACT_AHEAD) as extract_pool:
+            for index, video_path in enumerate(progress_files):
+                if self._shutdown_requested:
+                    print(f"{Colors.YELLOW}Processing interrupted by user{Colors.END}")
+                    break
+                
+                for ahead in range(index, min(index + 1 + self.EXTRACT_AHEAD, len(video_files))):
+                    if ahead not in pending:
+                        pending[ahead] = extract_pool.submit(self._extract_stage, video_files[ahead])
+                
+                self.process_single_file(video_path, extraction=pending.pop(index))
+            
+            # Files never reached (shutdown) need no decoding
+            self._discard_extractions(list(pending.values()))
+        
+        return not self._shutdown_requested
+    
+    def _process_batched(self, video_files: List[Path]) -> bool:
+        """
+        Process files in groups through the batched transformers backend.
+        
+        Audio for the next group is extracted in the background while the
+        current group is transcribed; 30 second chunks from all files in a
+        group share forward passes of batch_size chunks.
+        """
+        batch_size = self.config.processing_config.batch_size
+        
+        # Group files of similar length: rows of a decode batch then finish at
+        # about the same step instead of padding along behind the longest one.
+        # File size stands in for duration, which is only known after probing.
+        def file_size(path: Path) -> int:
+            # A file removed since discovery fails later, in its own extraction
+            try:
+                return path.stat().st_size
+            except OSError:
+                return 0
+        
+        video_files = sorted(video_files, key=file_size)
+        groups = [video_files[i:i + batch_size] for i in range(0, len(video_files), batch_size)]
+        
+        print(f"{Colors.BLUE}Starting batched processing with batch size {batch_size}...{Colors.END}")
+        
+        progress = None
+        if TQDM_AVAILABLE and not self.config.processing_config.quiet:
+            progress = tqdm(total=len(video_files), desc="Processing videos", unit="file")
+        
+        with ThreadPoolExecutor(max_workers=self.EXTRACT_AHEAD) as extract_pool:
+            next_extractions = [extract_pool.submit(self._extract_stage, v) for v in groups[0]]
+            
+            for group_index, group in enumerate(groups):
+                extractions = next_extractions
+                if self._shutdown_requested:
+                    print(f"{Colors.YELLOW}Processing interrupted by user{Colors.END}")
+                    self._discard_extractions(extractions)
+                    break
+                
+                next_extractions = []
+                if group_index + 1 < len(groups):
+                    next_extractions = [extract_pool.submit(self._extract_stage, v)
+                                        for v in groups[group_index + 1]]
+                
+                # (video_path, audio, duration) for files ready to transcribe
+                ready = []
+                for video_path, extraction in zip(group, extractions):
+                    self.stats.processed += 1
+                    try:
+                        audio, video_info, error_msg = extraction.result()
+                    except Exception as e:
+                        self._record_failure(video_path, str(e))
+                        continue
+                    
+                    if audio is None:
+                        self.log.error(f"✗ Validation failed: {error_msg}")
+                        self._mark_processed(video_path, success=False, error=error_msg)
+                        continue
+                    
+                    ready.append((video_path, audio, video_info.get('duration', 0.0)))
+                
+                if ready:
+                    start_time = time.time()
+                    try:
+                        results = self.transcriber.transcribe_batch(
+                            [audio for _, audio, _ in ready],
+                            language=self.config.processing_config.language,
+                            batch_size=batch_size
+                        )
+                    except Exception as e:
+                        processing_time = (time.time() - start_time) / len(ready)
+                        for video_path, _, video_duration in ready:
+                            self._record_failure(video_path, str(e), video_duration, processing_time)
+                    else:
+                        for (video_path, _, video_duration), result in zip(ready, results):
+                            try:
+                                self._finish_file(video_path, video_duration,
+                                                  result, result.processing_time)
+                            except Exception as e:
+                                self._record_failure(video_path, str(e), video_duration,
+                                                     result.processing_time)
+                
+                if progress is not None:
+                    progress.update(len(group))
             
-            self.process_single_file(video_path)
+            # Files never reached (shutdown) need no decoding
+            self._discard_extractions(next_extractions)
+        
+        if progress is not None:
+            progress.close()
         
         return not self._shutdown_requested
     
     def _process_concurrent(self, video_files: List[Path]) -> bool:
-        """Process files concurrently."""
+        """
+        Process files concurrently in worker processes.
+        
+        Workers on a single GPU share the parent's weights; otherwise every
+        worker loads its own model.
+        """
         max_workers = min(self.config.processing_config.max_workers, len(video_files))
         
         print(f"{Colors.BLUE}Starting concurrent processing with {max_workers} workers...{Colors.END}")
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        config_dict = {
+            'processing': asdict(self.config.processing_config),
+            'audio': asdict(self.config.audio_config)
+        }
+        
+        # Spread CUDA workers across all visible GPUs
+        device_assignment = None
+        if self.config.get_effective_device() == 'cuda':
+            _, device_info = self.platform_utils.detect_device()
+            if device_info.get('gpu_count', 0) > 1:
+                device_assignment = list(range(device_info['gpu_count']))
+        
+        # On a single GPU, load the weights once here and hand the workers CUDA
+        # IPC handles to them instead of one copy per worker (no IPC on Windows).
+        # The parent never transcribes, so it skips torch.compile and its warmup
+        shared_model = None
+        if (self.config.get_effective_device() == 'cuda' and device_assignment is None
+                and self.config.processing_config.backend == 'openai'
+                and not self.platform_utils.is_windows and _supports_assign()):
+            if self._load_whisper_model(compile_model=False):
+                shared_model = self.transcriber.export_shared_model()
+        
+        # CPU workers split the cores between them; otherwise every worker's
+        # BLAS/OpenMP pool claims all cores and they thrash each other
+        cpu_threads = None
+        if self.config.get_effective_device() == 'cpu':
+            cpu_threads = max(1, (os.cpu_count() or 1) // max_workers)
+        
+        # spawn avoids forking a parent that may already hold a CUDA context
+        mp_context = multiprocessing.get_context('spawn')
+        worker_counter = mp_context.Value('i', 0)
+        # Lock-free so the signal handler can set it safely
+        self._worker_stop = mp_context.RawValue('b', 0)
+        
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_worker_init,
+            initargs=(config_dict, device_assignment, worker_counter,
+                      self.move_to_done, self.done_dir, shared_model, self._worker_stop,
+                      _LOG_QUEUE, logging.getLogger().level, cpu_threads)
+        )
+        try:
             # Submit all tasks
             future_to_video = {
-                executor.submit(self.process_single_file, video_path): video_path
+                executor.submit(_worker_process, str(video_path)): video_path
                 for video_path in video_files
             }
             
             # Process completed tasks
+            progress = None
             if TQDM_AVAILABLE and not self.config.processing_config.quiet:
-                futures = tqdm(as_completed(future_to_video), 
-                             total=len(video_files), 
-                             desc="Processing videos", 
-                             unit="file")
-            else:
-                futures = as_completed(future_to_video)
+                progress = tqdm(total=len(video_files), desc="Processing videos", unit="file")
             
-            for future in futures:
-                if self._shutdown_requested:
-                    print(f"{Colors.YELLOW}Cancelling remaining tasks...{Colors.END}")
-                    for remaining_future in future_to_video:
-                        remaining_future.cancel()
-                    break
+            def collect(future):
+                if progress is not None:
+                    progress.update()
                 
+                video_path = future_to_video[future]
                 try:
-                    future.result()  # Get result to catch any exceptions
+                    outcome = future.result()
                 except Exception as e:
-                    video_path = future_to_video[future]
-                    print(f"{Colors.RED}Error in worker processing {video_path.name}: {e}{Colors.END}")
+                    self.log.error(f"Error in worker processing {video_path.name}: {e}")
+                    self.stats.processed += 1
+                    self.stats.failed += 1
+                    return
+                
+                # Workers report back instead of writing the shared history file
+                for record in outcome['records']:
+                    self.file_manager.mark_processed(video_path, **record)
+                self.stats.merge(outcome['stats'])
+            
+            pending = set(future_to_video)
+            while pending:
+                # Time out regularly so a shutdown is noticed while every worker is busy
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+                
+                if self._shutdown_requested:
+                    print(f"{Colors.YELLOW}Cancelling remaining tasks...{Colors.END}")
+                    # Drop queued files; running ones stop at their next checkpoint
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    
+                    # A file past its last checkpoint still writes its transcript,
+                    # so record it too or --skip-existing would redo it. The
+                    # executor cancels queued futures from its own thread, and a
+                    # cancelled future never wakes wait(), so drop them as they go.
+                    while pending:
+                        done, pending = wait(pending, timeout=0.5)
+                        for future in done:
+                            if not future.cancelled():
+                                collect(future)
+                        pending = {future for future in pending if not future.cancelled()}
+                    break
+            
+            if progress is not None:
+                progress.close()
+        finally:
+            executor.shutdown(wait=True)
+            self._worker_stop = None
         
         return not self._shutdown_requested
     
     def _print_final_stats(self):
         """Print final processing statistics."""
-        total_time = time.time() - self.stats['start_time']
+        # Per-file messages go through the logging queue; let them land first
+        flush_logging()
+        total_time = time.time() - self.stats.start_time
         
         print(f"{Colors.CYAN}{Colors.BOLD}")
         print("=" * 60)
@@ -424,41 +774,180 @@ class MP4ToTextProcessor:
         print("=" * 60)
         print(f"{Colors.END}")
         
-        print(f"Total files: {self.stats['total_files']}")
-        print(f"Processed: {self.stats['processed']}")
-        print(f"Successful: {Colors.GREEN}{self.stats['successful']}{Colors.END}")
-        print(f"Failed: {Colors.RED}{self.stats['failed']}{Colors.END}")
-        print(f"Skipped: {Colors.YELLOW}{self.stats.get('skipped', 0)}{Colors.END}")
+        print(f"Total files: {self.stats.total_files}")
+        print(f"Processed: {self.stats.processed}")
+        print(f"Successful: {Colors.GREEN}{self.stats.successful}{Colors.END}")
+        print(f"Failed: {Colors.RED}{self.stats.failed}{Colors.END}")
+        print(f"Skipped: {Colors.YELLOW}{self.stats.skipped}{Colors.END}")
         
-        if self.stats['processed'] > 0:
-            success_rate = (self.stats['successful'] / self.stats['processed']) * 100
+        if self.stats.processed > 0:
+            success_rate = (self.stats.successful / self.stats.processed) * 100
             print(f"Success rate: {success_rate:.1f}%")
         
         print(f"\nTiming:")
         print(f"Total time: {total_time:.1f}s")
-        print(f"Total audio duration: {self.stats['total_duration']:.1f}s")
-        print(f"Total processing time: {self.stats['total_processing_time']:.1f}s")
+        print(f"Total audio duration: {self.stats.total_duration:.1f}s")
+        print(f"Total processing time: {self.stats.total_processing_time:.1f}s")
         
-        if self.stats['total_duration'] > 0:
-            avg_rtf = self.stats['total_processing_time'] / self.stats['total_duration']
+        if self.stats.total_duration > 0:
+            avg_rtf = self.stats.total_processing_time / self.stats.total_duration
             print(f"Average RTF: {avg_rtf:.2f}")
         
-        if self.stats['successful'] > 0:
-            avg_time_per_file = self.stats['total_processing_time'] / self.stats['successful']
+        if self.stats.successful > 0:
+            avg_time_per_file = self.stats.total_processing_time / self.stats.successful
             print(f"Average time per file: {avg_time_per_file:.1f}s")
         
         print()
 
 
+class _WorkerProcessor(MP4ToTextProcessor):
+    """Processor used inside pool workers; results are returned to the parent."""
+    
+    def __init__(self, *args, stop_flag=None, **kwargs):
+        self.pending_records: List[Dict[str, Any]] = []
+        self._stop_flag = stop_flag
+        super().__init__(*args, **kwargs)
+    
+    @property
+    def _shutdown_requested(self) -> bool:
+        """Follow the parent's stop flag so running files bail out early."""
+        return self._stop_flag is not None and bool(self._stop_flag.value)
+    
+    def _setup_signal_handlers(self):
+        """Leave Ctrl+C to the parent, which cancels pending work."""
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    def _mark_processed(self, video_path: Path, **record):
+        """Defer history updates to the parent so workers never race on the file."""
+        self.pending_records.append(record)
+
+
+# Per-process processor, created once by _worker_init
+_WORKER_PROCESSOR: Optional[_WorkerProcessor] = None
+
+
+def _worker_init(config_dict: Dict[str, Dict[str, Any]], device_assignment: Optional[List[int]],
+                 worker_counter, move_to_done: bool, done_dir: Optional[str],
+                 shared_model: Optional[Dict[str, Any]] = None, stop_flag=None,
+                 log_queue=None, log_level: int = logging.INFO,
+                 cpu_threads: Optional[int] = None):
+    """
+    Initialize a pool worker: rebuild the configuration and load the model once.
+    
+    Args:
+        config_dict: Processing and audio configuration as plain dicts
+        device_assignment: GPU indices to distribute workers over, or None
+        worker_counter: Shared counter used to number the workers
+        move_to_done: Whether to move processed videos
+        done_dir: Destination for processed videos
+        shared_model: Weights exported by the parent (CUDA IPC), or None to
+            load a private copy
+        stop_flag: Shared value the parent sets to 1 on shutdown
+        log_queue: The parent's logging queue, or None if logging is not set up
+        log_level: Root logger level in the parent
+        cpu_threads: Intra-op threads for CPU inference, or None for the default
+    """
+    global _WORKER_PROCESSOR
+    
+    # Read by OpenMP/MKL when torch is first imported (it is loaded lazily)
+    if cpu_threads:
+        for variable in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+            os.environ[variable] = str(cpu_threads)
+    
+    # Spawned workers start without handlers; send records to the parent's listener
+    if log_queue is not None:
+        root_logger = logging.getLogger()
+        root_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+        root_logger.setLevel(log_level)
+    
+    if device_assignment:
+        with worker_counter.get_lock():
+            worker_index = worker_counter.value
+            worker_counter.value += 1
+        # Must be set before CUDA is initialized in this process
+        os.environ['CUDA_VISIBLE_DEVICES'] = str(device_assignment[worker_index % len(device_assignment)])
+    
+    config_manager = ConfigManager()
+    config_manager.processing_config = ProcessingConfig(**config_dict['processing'])
+    config_manager.audio_config = AudioConfig(**config_dict['audio'])
+    
+    _WORKER_PROCESSOR = _WorkerProcessor(config_manager, move_to_done=move_to_done,
+                                         done_dir=done_dir, stop_flag=stop_flag)
+    # Device detection may already have imported torch, so set its pool directly too
+    if cpu_threads and TORCH_AVAILABLE:
+        _import_torch().set_num_threads(cpu_threads)
+    if shared_model is not None:
+        _WORKER_PROCESSOR.transcriber.load_shared_model(shared_model)
+    elif not _WORKER_PROCESSOR.transcriber.load_model():
+        raise RuntimeError("Failed to load Whisper model in worker")
+
+
+def _worker_process(video_path_str: str) -> Dict[str, Any]:
+    """
+    Process one video in a pool worker.
+    
+    Args:
+        video_path_str: Path to the video file
+        
+    Returns:
+        Dict with the statistics delta and the history records for the parent
+    """
+    processor = _WORKER_PROCESSOR
+    processor.stats = ProcessingStats()
+    processor.pending_records.clear()
+    
+    processor.process_single_file(Path(video_path_str))
+    
+    return {
+        'stats': processor.stats,
+        'records': list(processor.pending_records)
+    }
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """Format console records like the tool's own output, colored by level or `color` extra."""
+    
+    LEVEL_COLORS = {logging.WARNING: Colors.YELLOW, logging.ERROR: Colors.RED}
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        color = getattr(record, 'color', None) or self.LEVEL_COLORS.get(record.levelno)
+        if record.name != 'mp4_to_text':
+            message = f"{record.levelname}: {message}"
+        return f"{color}{message}{Colors.END}" if color else message
+
+
+# Queue feeding the logging listener thread; shared with pool workers
+_LOG_QUEUE = None
+_LOG_LISTENER = None
+
+
+def flush_logging():
+    """Wait until every queued log record has been written."""
+    if _LOG_LISTENER is not None:
+        # stop() returns once the records queued before it are handled
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER.start()
+
+
 def setup_logging(config: ConfigManager):
-    """Setup logging configuration."""
+    """
+    Setup logging configuration.
+    
+    Handlers run on a single QueueListener thread, so processing threads and
+    pool workers only enqueue records instead of writing to the console or
+    log file themselves.
+    """
+    global _LOG_QUEUE, _LOG_LISTENER
+    
     log_level = getattr(logging, config.logging_config.level.upper(), logging.INFO)
     
     # Create formatters
     detailed_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    simple_formatter = logging.Formatter('%(levelname)s: %(message)s')
+    console_formatter = _ConsoleFormatter('%(message)s')
+    handlers = []
     
     # Setup root logger
     logger = logging.getLogger()
@@ -477,15 +966,28 @@ def setup_logging(config: ConfigManager):
                 encoding='utf-8'
             )
             file_handler.setFormatter(detailed_formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             print(f"Warning: Failed to setup file logging: {e}")
     
-    # Console handler
-    if config.logging_config.console_output and not config.processing_config.quiet:
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(simple_formatter)
-        logger.addHandler(console_handler)
+    # Console handler; quiet mode (which turns console_output off) still
+    # reports warnings and errors, as it did when they were printed directly
+    if config.logging_config.console_output or config.processing_config.quiet:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(console_formatter)
+        if config.processing_config.quiet:
+            console_handler.setLevel(logging.WARNING)
+        handlers.append(console_handler)
+    
+    if not handlers:
+        return
+    
+    # spawn-context queue so pool workers can forward their records too
+    _LOG_QUEUE = multiprocessing.get_context('spawn').Queue(-1)
+    _LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, *handlers, respect_handler_level=True)
+    _LOG_LISTENER.start()
+    atexit.register(_LOG_LISTENER.stop)
+    logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -515,6 +1017,17 @@ Supported languages: auto, zh, en, ja, ko, fr, de, es, ru, pt, it, ar, hi
     parser.add_argument('-m', '--model', type=str, default='medium',
                         choices=['tiny', 'base', 'small', 'medium', 'large', 'large-v2', 'large-v3'],
                         help='Whisper model to use (default: medium)')
+    parser.add_argument('--backend', type=str,
+                        choices=['openai', 'faster', 'transformers'],
+                        help='Inference backend: openai-whisper, faster-whisper (CTranslate2) '
+                             'or Hugging Face transformers (default: openai)')
+    parser.add_argument('--quantize', type=str,
+                        choices=['none', 'int8', 'int4'],
+                        help='Weight quantization: int8 on CPU, int4 with the transformers '
+                             'backend on CUDA (default: int8)')
+    parser.add_argument('--model-cache', action='store_true',
+                        help='Keep a memory-mappable copy of openai-whisper models in '
+                             '~/.cache/mp4totext for faster loading (uses extra disk space)')
     parser.add_argument('-l', '--language', type=str, default='auto',
                         help='Audio language (auto/zh/en/ja/ko/fr/de/es/ru/pt/it/ar/hi)')
     parser.add_argument('-d', '--device', type=str, default='auto',
@@ -524,6 +1037,9 @@ Supported languages: auto, zh, en, ja, ko, fr, de, es, ru, pt, it, ar, hi
     # Parallel processing
     parser.add_argument('-w', '--workers', type=int, default=1,
                         help='Number of parallel workers (default: 1)')
+    parser.add_argument('--batch-size', type=int,
+                        help='Audio chunks per GPU forward pass with --backend transformers '
+                             '(default: 1)')
     
     # Behavior options
     parser.add_argument('-s', '--skip-existing', action='store_true',
@@ -613,7 +1129,7 @@ def main():
         # Cleanup on exit
         try:
             if 'processor' in locals():
-                processor.transcriber.unload_model()
+                processor.release_model()
         except Exception:
             pass
 
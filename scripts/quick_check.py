@@ -5,9 +5,23 @@
 
 import sys
 import os
+import argparse
+import ctypes
+import functools
+import importlib
+import importlib.util
+import io
+import shutil
 import subprocess
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# 添加项目根目录到路径（检查并行运行，需在任何检查开始前设置）
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
 # 颜色定义
 class Colors:
     GREEN = '\033[92m'
@@ -17,14 +31,15 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
+# 预先拼好的状态标记
+_OK = f"{Colors.GREEN}✓{Colors.ENDC}"
+_WARN = f"{Colors.YELLOW}⚠{Colors.ENDC}"
+_ERR = f"{Colors.RED}✗{Colors.ENDC}"
+_STATUS_MARKS = {'OK': _OK, 'WARNING': _WARN}
+
 def print_status(message, status, details=""):
     """打印状态信息"""
-    if status == "OK":
-        status_color = Colors.GREEN + "✓" + Colors.ENDC
-    elif status == "WARNING":
-        status_color = Colors.YELLOW + "⚠" + Colors.ENDC
-    else:  # ERROR
-        status_color = Colors.RED + "✗" + Colors.ENDC
+    status_color = _STATUS_MARKS.get(status, _ERR)  # 其他状态均视为ERROR
     
     print(f"{status_color} {message}")
     if details:
@@ -42,78 +57,147 @@ def check_python_version():
         print_status(f"Python版本: {version_str}", "ERROR", "需要Python 3.9或更高版本")
         return False
 
+# (包名, 导入名)
+PACKAGES = (
+    ('torch', 'torch'),
+    ('openai-whisper', 'whisper'),
+    ('ffmpeg-python', 'ffmpeg'),
+    ('tqdm', 'tqdm'),
+    ('psutil', 'psutil'),
+    ('configparser', 'configparser')
+)
+
 def check_package_import(package_name, import_name=None):
-    """检查Python包是否可以导入"""
+    """检查Python包是否已安装（只查找模块，不执行导入）"""
     if import_name is None:
         import_name = package_name
     
-    try:
-        __import__(import_name)
+    if importlib.util.find_spec(import_name) is not None:
         print_status(f"Python包 {package_name}", "OK")
         return True
-    except ImportError:
+    else:
         print_status(f"Python包 {package_name}", "ERROR", f"无法导入 {import_name}")
         return False
 
-def check_ffmpeg():
-    """检查FFmpeg是否可用"""
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_version(path):
+    """运行一次 ffmpeg -version 并缓存首行，失败时返回None"""
     try:
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            version_line = result.stdout.split('\n')[0]
-            print_status("FFmpeg", "OK", version_line)
-            return True
-        else:
-            print_status("FFmpeg", "ERROR", "FFmpeg命令失败")
-            return False
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+        result = subprocess.run([path, '-version'], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, timeout=5)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.split(b'\n', 1)[0].decode(errors='replace')
+
+# FFmpeg 共享库的常见文件名（从新到旧），直接按名称加载，避免 ctypes.util.find_library 启动 ldconfig
+_AVUTIL_LIBRARIES = (
+    ('libavutil.so',) + tuple(f'libavutil.so.{major}' for major in range(59, 55, -1))
+    + ('libavutil.dylib',) + tuple(f'avutil-{major}.dll' for major in range(59, 55, -1))
+)
+
+@functools.lru_cache(maxsize=1)
+def _avutil_version():
+    """在当前进程中读取libavutil版本，无可用共享库时返回None"""
+    for name in _AVUTIL_LIBRARIES:
+        try:
+            avutil_version = ctypes.CDLL(name).avutil_version
+        except (OSError, AttributeError):
+            continue
+        avutil_version.restype = ctypes.c_uint
+        version = avutil_version()
+        return f"libavutil {version >> 16 & 0xff}.{version >> 8 & 0xff}.{version & 0xff}"
+    return None
+
+def check_packages():
+    """一次检查 PACKAGES 中的所有包，返回每个包的结果"""
+    return [check_package_import(package_name, import_name)
+            for package_name, import_name in PACKAGES]
+
+def check_ffmpeg(show_version=False):
+    """检查FFmpeg是否可用（只查找PATH，需要版本时才启动ffmpeg）
+    
+    打包/Docker/CI环境可通过 MP4TOTEXT_FFMPEG_VERSION 直接给出版本，
+    MP4TOTEXT_FFMPEG 给出ffmpeg路径，从而完全跳过探测。
+    """
+    env_version = os.environ.get('MP4TOTEXT_FFMPEG_VERSION')
+    if env_version:
+        print_status("FFmpeg", "OK", env_version)
+        return True
+    
+    path = os.environ.get('MP4TOTEXT_FFMPEG') or shutil.which('ffmpeg')
+    if not path:
         print_status("FFmpeg", "ERROR", "FFmpeg未找到或无法执行")
         return False
+    
+    if not show_version:
+        print_status("FFmpeg", "OK", path)
+        return True
+    
+    # 优先读取共享库版本，只有在没有libavutil时才启动 ffmpeg -version
+    version_line = _avutil_version() or _ffmpeg_version(path)
+    if version_line is None:
+        print_status("FFmpeg", "ERROR", "FFmpeg命令失败")
+        return False
+    print_status("FFmpeg", "OK", version_line)
+    return True
+
+# 项目结构检查清单（相对项目根目录）
+_REQUIRED_FILES = (
+    'mp4_to_text.py',
+    'requirements.txt',
+    'README.md',
+    'core/__init__.py',
+    'core/platform_utils.py',
+    'core/config_manager.py',
+    'core/file_manager.py',
+    'core/audio_processor.py',
+    'core/transcriber.py',
+    'config/config.ini',
+    'config/models.json',
+    'examples/usage_examples.py',
+    'examples/sample_config.ini',
+)
+
+_REQUIRED_DIRS = (
+    'core',
+    'config',
+    'temp',
+    'logs',
+    'tests',
+    'examples',
+    'scripts',
+)
 
 def check_project_structure():
     """检查项目结构"""
-    required_files = [
-        'mp4_to_text.py',
-        'requirements.txt',
-        'README.md',
-        'core/__init__.py',
-        'core/platform_utils.py',
-        'core/config_manager.py',
-        'core/file_manager.py',
-        'core/audio_processor.py',
-        'core/transcriber.py',
-        'config/config.ini',
-        'config/models.json',
-        'examples/usage_examples.py',
-        'examples/sample_config.ini'
-    ]
-    
-    required_dirs = [
-        'core',
-        'config',
-        'temp',
-        'logs',
-        'tests',
-        'examples',
-        'scripts'
-    ]
-    
     all_ok = True
     
+    # 每个父目录只扫描一次；DirEntry 自带文件类型，无需逐个 stat
+    listings = defaultdict(dict)
+    parents = {'.'} | {os.path.dirname(name) or '.' for name in _REQUIRED_FILES}
+    for parent in parents:
+        try:
+            with os.scandir(parent) as entries:
+                listings[parent] = {entry.name: entry for entry in entries}
+        except OSError:
+            pass
+    
     # 检查目录
-    for dir_name in required_dirs:
-        dir_path = Path(dir_name)
-        if dir_path.exists() and dir_path.is_dir():
+    for dir_name in _REQUIRED_DIRS:
+        entry = listings['.'].get(dir_name)
+        if entry is not None and entry.is_dir():
             print_status(f"目录 {dir_name}/", "OK")
         else:
             print_status(f"目录 {dir_name}/", "ERROR", "目录不存在")
             all_ok = False
     
     # 检查文件
-    for file_name in required_files:
-        file_path = Path(file_name)
-        if file_path.exists() and file_path.is_file():
+    for file_name in _REQUIRED_FILES:
+        parent, name = os.path.split(file_name)
+        entry = listings[parent or '.'].get(name)
+        if entry is not None and entry.is_file():
             print_status(f"文件 {file_name}", "OK")
         else:
             print_status(f"文件 {file_name}", "ERROR", "文件不存在")
@@ -121,8 +205,8 @@ def check_project_structure():
     
     return all_ok
 
-def check_core_modules():
-    """检查核心模块是否可以导入"""
+def check_core_modules(deep=False):
+    """检查核心模块是否存在，deep为True时实际导入"""
     modules = [
         'core.platform_utils',
         'core.config_manager',
@@ -134,7 +218,10 @@ def check_core_modules():
     all_ok = True
     for module in modules:
         try:
-            __import__(module)
+            if deep:
+                importlib.import_module(module)
+            elif importlib.util.find_spec(module) is None:
+                raise ImportError(f"No module named '{module}'")
             print_status(f"模块 {module}", "OK")
         except ImportError as e:
             print_status(f"模块 {module}", "ERROR", str(e))
@@ -142,11 +229,23 @@ def check_core_modules():
     
     return all_ok
 
-def check_whisper_models():
-    """检查Whisper模型信息"""
+@functools.lru_cache(maxsize=1)
+def _whisper_models():
+    """导入whisper并缓存可用模型列表（导入torch需要数秒）"""
+    import whisper
+    return tuple(whisper.available_models())
+
+def check_whisper_models(deep=False):
+    """检查Whisper模型信息，deep为True时导入whisper列出模型"""
+    if not deep:
+        if importlib.util.find_spec('whisper') is None:
+            print_status("Whisper模型", "ERROR", "未安装openai-whisper")
+            return False
+        print_status("Whisper模型", "OK", "已安装（使用 --deep 列出可用模型）")
+        return True
+    
     try:
-        import whisper
-        models = whisper.available_models()
+        models = _whisper_models()
         print_status(f"Whisper模型", "OK", f"可用模型: {', '.join(models)}")
         return True
     except Exception as e:
@@ -156,10 +255,6 @@ def check_whisper_models():
 def check_device_availability():
     """检查设备可用性"""
     try:
-        # 添加项目根目录到路径
-        project_root = Path(__file__).parent.parent
-        sys.path.insert(0, str(project_root))
-        
         from core.platform_utils import PlatformUtils
         platform_utils = PlatformUtils()
         
@@ -178,55 +273,90 @@ def check_device_availability():
         print_status("设备检测", "ERROR", str(e))
         return False
 
-def main():
-    """主函数"""
-    print(f"{Colors.BOLD}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}           MP4ToText 项目环境检查{Colors.ENDC}")
-    print(f"{Colors.BOLD}{'='*60}{Colors.ENDC}")
-    print()
+class _ThreadOutput(io.TextIOBase):
+    """替代sys.stdout：正在捕获的线程写入各自的缓冲区，其他输出照常打印
     
-    checks = []
+    contextlib.redirect_stdout 替换的是全局 sys.stdout，多个线程同时使用会互相覆盖。
+    """
     
-    print(f"{Colors.BLUE}1. 基础环境检查{Colors.ENDC}")
-    print("-" * 40)
-    checks.append(check_python_version())
-    checks.append(check_ffmpeg())
-    print()
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
     
-    print(f"{Colors.BLUE}2. Python依赖检查{Colors.ENDC}")
-    print("-" * 40)
-    packages = [
-        ('torch', 'torch'),
-        ('openai-whisper', 'whisper'),
-        ('ffmpeg-python', 'ffmpeg'),
-        ('tqdm', 'tqdm'),
-        ('psutil', 'psutil'),
-        ('configparser', 'configparser')
-    ]
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
     
-    for package_name, import_name in packages:
-        checks.append(check_package_import(package_name, import_name))
-    print()
+    def flush(self):
+        self._stream.flush()
     
-    print(f"{Colors.BLUE}3. 项目结构检查{Colors.ENDC}")
-    print("-" * 40)
-    checks.append(check_project_structure())
-    print()
+    def capture(self, check, *args, **kwargs):
+        """运行一个检查，返回 (结果, 输出文本)"""
+        self._local.buffer = io.StringIO()
+        try:
+            result = check(*args, **kwargs)
+        finally:
+            output = self._local.buffer.getvalue()
+            self._local.buffer = None
+        return result, output
+
+def run_sections(sections):
+    """并行运行所有检查，按声明顺序输出每一节，返回全部检查结果"""
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                (title, [executor.submit(output.capture, check, *args, **kwargs)
+                         for check, args, kwargs in checks])
+                for title, checks in sections
+            ]
+            
+            results = []
+            for title, section_futures in futures:
+                # 整节拼好后一次写出
+                parts = [f"{Colors.BLUE}{title}{Colors.ENDC}\n", "-" * 40 + "\n"]
+                for future in section_futures:
+                    result, text = future.result()
+                    parts.append(text)
+                    # 批量检查返回结果列表
+                    if isinstance(result, list):
+                        results.extend(result)
+                    else:
+                        results.append(result)
+                parts.append("\n")
+                sys.stdout.write(''.join(parts))
+                sys.stdout.flush()
+    finally:
+        sys.stdout = output._stream
+    return results
+
+def main(argv=None):
+    """主函数"""
+    parser = argparse.ArgumentParser(description="MP4ToText 项目环境检查")
+    parser.add_argument('--deep', action='store_true',
+                        help='实际导入核心模块和whisper，并显示FFmpeg版本（较慢）')
+    args = parser.parse_args(argv)
     
-    print(f"{Colors.BLUE}4. 核心模块检查{Colors.ENDC}")
-    print("-" * 40)
-    checks.append(check_core_modules())
+    print(f"{Colors.BOLD}{'='*60}{Colors.ENDC}")
+    print(f"{Colors.BOLD}           MP4ToText 项目环境检查{Colors.ENDC}")
+    print(f"{Colors.BOLD}{'='*60}{Colors.ENDC}")
     print()
     
-    print(f"{Colors.BLUE}5. Whisper模型检查{Colors.ENDC}")
-    print("-" * 40)
-    checks.append(check_whisper_models())
-    print()
+    # 每节: (标题, [(检查函数, 位置参数, 关键字参数), ...])
+    sections = [
+        ("1. 基础环境检查", [
+            (check_python_version, (), {}),
+            (check_ffmpeg, (), {'show_version': args.deep})
+        ]),
+        ("2. Python依赖检查", [(check_packages, (), {})]),
+        ("3. 项目结构检查", [(check_project_structure, (), {})]),
+        ("4. 核心模块检查", [(check_core_modules, (), {'deep': args.deep})]),
+        ("5. Whisper模型检查", [(check_whisper_models, (), {'deep': args.deep})]),
+        ("6. 设备兼容性检查", [(check_device_availability, (), {})])
+    ]
     
-    print(f"{Colors.BLUE}6. 设备兼容性检查{Colors.ENDC}")
-    print("-" * 40)
-    checks.append(check_device_availability())
-    print()
+    checks = run_sections(sections)
     
     # 总结
     print(f"{Colors.BOLD}{'='*60}{Colors.ENDC}")
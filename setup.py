@@ -8,6 +8,12 @@ import platform
 from pathlib import Path
 from setuptools import setup, find_packages
 
+try:
+    from packaging.requirements import Requirement
+except ImportError:
+    # Older setuptools only ship packaging in vendored form
+    from setuptools.extern.packaging.requirements import Requirement
+
 # Read README file
 def read_readme():
     readme_path = Path(__file__).parent / "README.md"
@@ -23,19 +29,16 @@ def read_requirements():
         with open(req_path, 'r', encoding='utf-8') as f:
             lines = f.readlines()
         
-        # Filter out comments and empty lines
+        # Filter out comments, pip options and empty lines
         requirements = []
         for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#') and not line.startswith('--'):
-                # Handle platform-specific requirements
-                if ';' in line:
-                    pkg, condition = line.split(';', 1)
-                    # Only add if condition matches current platform
-                    if eval_condition(condition.strip()):
-                        requirements.append(pkg.strip())
-                else:
-                    requirements.append(line)
+            line = line.split('#', 1)[0].strip()
+            if line and not line.startswith('--'):
+                # Only add if the PEP 508 marker (if any) matches this environment
+                req = Requirement(line)
+                if req.marker is None or req.marker.evaluate():
+                    req.marker = None
+                    requirements.append(str(req))
         
         return requirements
     
@@ -45,21 +48,12 @@ def read_requirements():
         'ffmpeg-python>=0.2.0',
         'torch>=2.0.0',
         'torchaudio>=2.0.0',
+        'numpy>=1.21.0',
         'tqdm>=4.65.0',
         'colorama>=0.4.6',
         'pathvalidate>=3.0.0'
     ]
 
-def eval_condition(condition):
-    """Evaluate platform condition for requirements."""
-    try:
-        # Replace common variables
-        condition = condition.replace('sys_platform', f'"{sys.platform}"')
-        condition = condition.replace('python_version', f'"{sys.version_info.major}.{sys.version_info.minor}"')
-        return eval(condition)
-    except:
-        return True  # Include by default if evaluation fails
-
 # Platform-specific dependencies
 def get_platform_dependencies():
     """Get additional dependencies based on platform."""
@@ -154,6 +148,10 @@ setup(
         'gpu': [
             'torch[cuda]>=2.0.0',  # CUDA support
         ],
+        'fast': [
+            'soundfile>=0.12.0',  # In-process WAV decoding (falls back to FFmpeg)
+            'orjson>=3.8.0',  # Fast JSON output (falls back to json)
+        ],
         'all': [
             'psutil>=5.9.0',  # System resource monitoring
             'jupyter>=1.0.0',  # Jupyter notebook support
@@ -200,6 +198,9 @@ def print_installation_info():
     else:
         print("   - Ubuntu/Debian: sudo apt install ffmpeg")
         print("   - CentOS/RHEL: sudo yum install ffmpeg")
+    print("   In packaged/CI environments, set MP4TOTEXT_FFMPEG_VERSION (and")
+    print("   optionally MP4TOTEXT_FFMPEG=/path/to/ffmpeg) to skip the ffmpeg probe")
+    print("   in scripts/quick_check.py.")
     
     print("\n2. Test the installation:")
     print("   mp4-to-text --system-info")
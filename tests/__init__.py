@@ -0,0 +1,11 @@
+"""
+MP4ToText 测试包
+
+单个模块可在项目根目录下运行：python -m tests.test_file_manager
+"""
+
+import sys
+from pathlib import Path
+
+# 添加项目根目录到Python路径（所有测试模块共用，run_tests.py 自行设置）
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -6,62 +6,101 @@
 import unittest
 import sys
 import os
+import io
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-def main():
+# 测试模块列表（新增测试模块时在此登记）
+TEST_MODULES = (
+    'test_audio_processor',
+    'test_config_manager',
+    'test_file_manager',
+    'test_mp4_to_text',
+    'test_platform_utils',
+    'test_transcriber',
+)
+
+def run_module(module_name):
+    """在子进程中运行一个测试模块，返回可序列化的结果"""
+    suite = unittest.TestLoader().loadTestsFromName(module_name)
+    stream = io.StringIO()
+    runner = unittest.TextTestRunner(
+        stream=stream,
+        verbosity=2,
+        buffer=True,
+        failfast=False
+    )
+    result = runner.run(suite)
+    return {
+        'output': stream.getvalue(),
+        'tests_run': result.testsRun,
+        'failures': [str(test) for test, _ in result.failures],
+        'errors': [str(test) for test, _ in result.errors]
+    }
+
+def main(argv=None):
     """运行所有测试"""
+    parser = argparse.ArgumentParser(description="MP4ToText 项目测试")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='并行运行的测试模块数（默认: CPU核心数）')
+    args = parser.parse_args(argv)
+    
     print("=" * 60)
     print("           MP4ToText 项目测试")
     print("=" * 60)
     
     # 设置测试目录
     test_dir = Path(__file__).parent
+    sys.path.insert(0, str(test_dir))
     
-    # 发现并运行测试
-    loader = unittest.TestLoader()
-    suite = loader.discover(str(test_dir), pattern='test_*.py')
-    
-    # 设置测试运行器
-    runner = unittest.TextTestRunner(
-        verbosity=2,
-        buffer=True,
-        failfast=False
-    )
+    # 每个测试模块在独立进程中运行（各测试类使用独立的临时目录，互不影响）
+    module_names = TEST_MODULES
+    suite = unittest.TestLoader().loadTestsFromNames(module_names)
     
     # 运行测试
     print(f"发现测试模块: {suite.countTestCases()} 个测试")
     print("-" * 60)
     
-    result = runner.run(suite)
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(module_names)))) as executor:
+        results = list(executor.map(run_module, module_names))
+    
+    # 按模块顺序输出各自的测试日志
+    for module_result in results:
+        sys.stdout.write(module_result['output'])
+    
+    tests_run = sum(r['tests_run'] for r in results)
+    failures = [test for r in results for test in r['failures']]
+    errors = [test for r in results for test in r['errors']]
     
     # 输出测试结果摘要
     print("\n" + "=" * 60)
     print("                测试结果摘要")
     print("=" * 60)
     
-    print(f"运行测试数量: {result.testsRun}")
-    print(f"成功: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"失败: {len(result.failures)}")
-    print(f"错误: {len(result.errors)}")
+    print(f"运行测试数量: {tests_run}")
+    print(f"成功: {tests_run - len(failures) - len(errors)}")
+    print(f"失败: {len(failures)}")
+    print(f"错误: {len(errors)}")
     
-    if result.failures:
+    if failures:
         print("\n失败的测试:")
-        for test, traceback in result.failures:
+        for test in failures:
             print(f"  - {test}")
     
-    if result.errors:
+    if errors:
         print("\n错误的测试:")
-        for test, traceback in result.errors:
+        for test in errors:
             print(f"  - {test}")
     
     print("\n" + "=" * 60)
     
     # 根据测试结果返回适当的退出码
-    if result.wasSuccessful():
+    if not failures and not errors:
         print("✅ 所有测试通过！")
         return 0
     else:
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+测试音频处理模块
+"""
+
+import contextlib
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from core import audio_processor
+from core.audio_processor import AudioProcessor, PCM_SAMPLE_RATE
+
+
+class TestSplitChunks(unittest.TestCase):
+    """音频分块测试类"""
+    
+    def test_chunks_overlap(self):
+        """测试相邻分块按重叠长度衔接"""
+        samples = np.arange(70 * PCM_SAMPLE_RATE, dtype=np.float32)
+        chunks, offsets = AudioProcessor.split_chunks(samples, chunk_len=30.0, overlap=1.0)
+        
+        self.assertEqual(offsets, [0.0, 29.0, 58.0])
+        self.assertEqual([len(c) for c in chunks],
+                         [30 * PCM_SAMPLE_RATE, 30 * PCM_SAMPLE_RATE, 12 * PCM_SAMPLE_RATE])
+        # 重叠部分在两个分块中相同
+        self.assertTrue(np.array_equal(chunks[0][-PCM_SAMPLE_RATE:], chunks[1][:PCM_SAMPLE_RATE]))
+        # 最后一个分块到达音频末尾
+        self.assertEqual(chunks[-1][-1], samples[-1])
+    
+    def test_chunks_are_views(self):
+        """测试分块不复制音频数据"""
+        samples = np.zeros(45 * PCM_SAMPLE_RATE, dtype=np.float32)
+        chunks, _ = AudioProcessor.split_chunks(samples)
+        for chunk in chunks:
+            self.assertTrue(np.shares_memory(chunk, samples))
+    
+    def test_no_trailing_overlap_chunk(self):
+        """测试不会产生只包含重叠部分的末尾分块"""
+        samples = np.zeros(59 * PCM_SAMPLE_RATE, dtype=np.float32)
+        chunks, offsets = AudioProcessor.split_chunks(samples, chunk_len=30.0, overlap=1.0)
+        self.assertEqual(offsets, [0.0, 29.0])
+        self.assertEqual(len(chunks[-1]), 30 * PCM_SAMPLE_RATE)
+    
+    def test_short_audio(self):
+        """测试短于一个分块的音频"""
+        samples = np.zeros(PCM_SAMPLE_RATE // 2, dtype=np.float32)
+        chunks, offsets = AudioProcessor.split_chunks(samples)
+        self.assertEqual(offsets, [0.0])
+        self.assertEqual(len(chunks[0]), len(samples))
+
+
+# 可以直接复制的音轨信息（16kHz单声道PCM）
+COPYABLE_INFO = {
+    'duration': 10.0,
+    'has_audio': True,
+    'audio_codec': 'pcm_s16le',
+    'audio_sample_rate': 16000,
+    'audio_channels': 1
+}
+
+
+class TestExtractionMode(unittest.TestCase):
+    """音频提取模式测试类（不调用FFmpeg）"""
+    
+    def setUp(self):
+        """测试前设置"""
+        self._stack = contextlib.ExitStack()
+        self.temp_dir = Path(self._stack.enter_context(tempfile.TemporaryDirectory()))
+        # 测试不运行FFmpeg，跳过查找
+        self._stack.enter_context(mock.patch.object(AudioProcessor, '_find_ffmpeg', return_value='ffmpeg'))
+        self.audio_processor = AudioProcessor(str(self.temp_dir / 'temp'))
+        
+        self.video_path = self.temp_dir / 'video.mp4'
+        self.video_path.touch()
+    
+    def tearDown(self):
+        """测试后清理"""
+        self._stack.close()
+    
+    def _extract(self, video_info, **kwargs):
+        """以给定的视频信息提取音频，返回提取函数的调用记录"""
+        with mock.patch.object(self.audio_processor, 'get_video_info', return_value=video_info), \
+             mock.patch.object(self.audio_processor, '_extract_audio_subprocess') as subprocess_extract, \
+             mock.patch.object(self.audio_processor, '_extract_audio_ffmpeg_python') as python_extract, \
+             mock.patch.object(audio_processor, 'FFMPEG_PYTHON_AVAILABLE', False):
+            self.audio_processor.extract_audio(self.video_path, **kwargs)
+        self.assertFalse(python_extract.called)
+        return subprocess_extract.call_args
+    
+    def test_can_stream_copy(self):
+        """测试只有格式一致的音轨可以直接复制"""
+        self.assertTrue(self.audio_processor._can_stream_copy(COPYABLE_INFO))
+        self.assertFalse(self.audio_processor._can_stream_copy(dict(COPYABLE_INFO, audio_codec='opus')))
+        self.assertFalse(self.audio_processor._can_stream_copy(dict(COPYABLE_INFO, audio_codec='aac')))
+        self.assertFalse(self.audio_processor._can_stream_copy(dict(COPYABLE_INFO, audio_sample_rate=44100)))
+        self.assertFalse(self.audio_processor._can_stream_copy(dict(COPYABLE_INFO, audio_channels=2)))
+    
+    def test_filters_prevent_stream_copy(self):
+        """测试启用音频滤镜时不能直接复制"""
+        self.audio_processor.config['normalize_audio'] = True
+        self.assertFalse(self.audio_processor._can_stream_copy(COPYABLE_INFO))
+    
+    def test_default_transcodes(self):
+        """测试默认按配置格式转码（即使音轨可以直接复制）"""
+        call = self._extract(COPYABLE_INFO)
+        self.assertFalse(call.kwargs.get('copy', False))
+        self.assertEqual(call.args[1].suffix, '.wav')
+    
+    def test_auto_copies_matching_track(self):
+        """测试auto模式直接复制格式一致的音轨到mka"""
+        call = self._extract(COPYABLE_INFO, mode='auto')
+        self.assertTrue(call.kwargs.get('copy'))
+        self.assertEqual(call.args[1].suffix, '.mka')
+    
+    def test_auto_transcodes_other_tracks(self):
+        """测试auto模式转码格式不一致的音轨"""
+        call = self._extract(dict(COPYABLE_INFO, audio_codec='aac'), mode='auto')
+        self.assertFalse(call.kwargs.get('copy', False))
+        self.assertEqual(call.args[1].suffix, '.wav')
+    
+    def test_auto_transcodes_with_output_path(self):
+        """测试指定输出路径时auto模式按配置格式转码"""
+        output_path = self.temp_dir / 'out.wav'
+        call = self._extract(COPYABLE_INFO, output_path=output_path, mode='auto')
+        self.assertFalse(call.kwargs.get('copy', False))
+        self.assertEqual(call.args[1], output_path)
+    
+    def test_forced_modes(self):
+        """测试强制copy和transcode模式"""
+        self.assertTrue(self._extract(dict(COPYABLE_INFO, audio_codec='aac'), mode='copy').kwargs.get('copy'))
+        self.assertFalse(self._extract(COPYABLE_INFO, mode='transcode').kwargs.get('copy', False))
+    
+    def test_invalid_mode(self):
+        """测试无效提取模式"""
+        with self.assertRaises(ValueError):
+            self.audio_processor.extract_audio(self.video_path, mode='remux')
+    
+    def test_no_audio_stream(self):
+        """测试没有音轨的视频"""
+        with self.assertRaises(ValueError):
+            self._extract(dict(COPYABLE_INFO, has_audio=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
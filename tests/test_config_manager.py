@@ -3,14 +3,12 @@
 测试配置管理模块
 """
 
+import contextlib
 import unittest
 import tempfile
 import os
-import sys
 from pathlib import Path
-
-# 添加项目根目录到Python路径
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from types import SimpleNamespace
 
 from core.config_manager import ConfigManager
 
@@ -21,19 +19,23 @@ class TestConfigManager(unittest.TestCase):
     def setUp(self):
         """测试前设置"""
         self.config_manager = ConfigManager()
-        self.temp_dir = tempfile.mkdtemp()
+        self._stack = contextlib.ExitStack()
+        self.temp_dir = self._stack.enter_context(tempfile.TemporaryDirectory())
     
     def tearDown(self):
         """测试后清理"""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        self._stack.close()
     
     def test_default_config_initialization(self):
         """测试默认配置初始化"""
         self.assertIsNotNone(self.config_manager.processing_config)
         self.assertIsNotNone(self.config_manager.audio_config)
         self.assertIsNotNone(self.config_manager.logging_config)
+        
+        # 分块解码会改变输出质量，默认关闭
+        self.assertEqual(self.config_manager.processing_config.chunk_threshold, 0)
+        # 模型缓存会额外占用磁盘空间，默认关闭
+        self.assertFalse(self.config_manager.processing_config.model_cache)
     
     def test_whisper_models_info(self):
         """测试Whisper模型信息"""
@@ -92,16 +94,14 @@ class TestConfigManager(unittest.TestCase):
     def test_command_line_args_update(self):
         """测试命令行参数更新"""
         # 模拟命令行参数
-        class MockArgs:
-            def __init__(self):
-                self.input = '/test/input'
-                self.output = '/test/output'
-                self.model = 'small'
-                self.language = 'en'
-                self.workers = 2
-                self.verbose = True
-        
-        args = MockArgs()
+        args = SimpleNamespace(
+            input='/test/input',
+            output='/test/output',
+            model='small',
+            language='en',
+            workers=2,
+            verbose=True
+        )
         self.config_manager.update_from_args(args)
         
         self.assertEqual(self.config_manager.processing_config.model_name, 'small')
@@ -113,23 +113,42 @@ class TestConfigManager(unittest.TestCase):
         """测试无效模型验证"""
         with self.assertRaises(ValueError):
             # 模拟无效模型的命令行参数
-            class MockArgsInvalid:
-                def __init__(self):
-                    self.model = 'invalid_model'
-            
-            args = MockArgsInvalid()
+            args = SimpleNamespace(model='invalid_model')
             self.config_manager.update_from_args(args)
     
     def test_invalid_language_validation(self):
         """测试无效语言验证"""
         with self.assertRaises(ValueError):
             # 模拟无效语言的命令行参数
-            class MockArgsInvalid:
-                def __init__(self):
-                    self.language = 'invalid_language'
-            
-            args = MockArgsInvalid()
+            args = SimpleNamespace(language='invalid_language')
             self.config_manager.update_from_args(args)
+    
+    def test_precision_settings_validation(self):
+        """测试精度与注意力实现配置验证"""
+        self.config_manager.processing_config.dtype = 'int3'
+        self.config_manager.processing_config.attn_impl = 'magic'
+        self.config_manager.processing_config.quantize = 'int2'
+        
+        errors = self.config_manager.validate_config()
+        self.assertTrue(any('dtype' in e for e in errors))
+        self.assertTrue(any('attention' in e.lower() for e in errors))
+        self.assertTrue(any('quantization' in e.lower() for e in errors))
+    
+    def test_precision_settings_save_load(self):
+        """测试精度与注意力实现配置保存和加载"""
+        config_file = Path(self.temp_dir) / 'test_precision.ini'
+        
+        self.config_manager.processing_config.dtype = 'fp32'
+        self.config_manager.processing_config.attn_impl = 'sdpa'
+        self.config_manager.processing_config.quantize = 'none'
+        self.config_manager.processing_config.model_cache = True
+        self.config_manager.save_config(str(config_file))
+        
+        new_config_manager = ConfigManager(config_file=str(config_file))
+        self.assertEqual(new_config_manager.processing_config.dtype, 'fp32')
+        self.assertEqual(new_config_manager.processing_config.attn_impl, 'sdpa')
+        self.assertEqual(new_config_manager.processing_config.quantize, 'none')
+        self.assertTrue(new_config_manager.processing_config.model_cache)
 
 
 if __name__ == '__main__':
@@ -3,32 +3,26 @@
 测试文件管理模块
 """
 
+import contextlib
 import unittest
 import tempfile
 import os
-import sys
 from pathlib import Path
 
-# 添加项目根目录到Python路径
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.file_manager import FileManager
 
 
 class TestFileManager(unittest.TestCase):
     """文件管理器测试类"""
     
-    def setUp(self):
-        """测试前设置"""
-        self.temp_input_dir = tempfile.mkdtemp()
-        self.temp_output_dir = tempfile.mkdtemp()
-        self.file_manager = FileManager(
-            input_dir=self.temp_input_dir,
-            output_dir=self.temp_output_dir
-        )
+    @classmethod
+    def setUpClass(cls):
+        """所有测试共用的输入目录（测试不会修改其中的文件）"""
+        cls._class_stack = contextlib.ExitStack()
+        cls.temp_input_dir = cls._class_stack.enter_context(tempfile.TemporaryDirectory())
         
         # 创建测试视频文件（空文件）
-        self.test_video_files = [
+        cls.test_video_files = [
             'video1.mp4',
             'video2.avi',
             'video3.mov',
@@ -36,16 +30,26 @@ class TestFileManager(unittest.TestCase):
             'audio.mp3'      # 不是支持的格式
         ]
         
-        for filename in self.test_video_files:
-            (Path(self.temp_input_dir) / filename).touch()
+        for filename in cls.test_video_files:
+            (Path(cls.temp_input_dir) / filename).touch()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """删除共用的输入目录"""
+        cls._class_stack.close()
+    
+    def setUp(self):
+        """测试前设置：每个测试使用独立的输出目录"""
+        self._stack = contextlib.ExitStack()
+        self.temp_output_dir = self._stack.enter_context(tempfile.TemporaryDirectory())
+        self.file_manager = FileManager(
+            input_dir=self.temp_input_dir,
+            output_dir=self.temp_output_dir
+        )
     
     def tearDown(self):
         """测试后清理"""
-        import shutil
-        if os.path.exists(self.temp_input_dir):
-            shutil.rmtree(self.temp_input_dir)
-        if os.path.exists(self.temp_output_dir):
-            shutil.rmtree(self.temp_output_dir)
+        self._stack.close()
     
     def test_initialization(self):
         """测试初始化"""
@@ -103,6 +107,26 @@ class TestFileManager(unittest.TestCase):
         # 如果不跳过已存在的文件，应该返回False
         self.assertFalse(self.file_manager.is_processed(video_path, skip_existing=False))
     
+    def test_processed_index(self):
+        """测试已处理文件索引"""
+        video_path = Path(self.temp_input_dir) / 'video1.mp4'
+        output_path = self.file_manager.get_output_path(video_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text("test transcription")
+        (self.file_manager.output_dir / 'empty.txt').touch()
+        
+        index = self.file_manager.build_processed_index()
+        self.assertIn(str(output_path), index)
+        self.assertNotIn(str(self.file_manager.output_dir / 'empty.txt'), index)
+        
+        # 索引结果应与逐个检查一致
+        self.file_manager.mark_processed(video_path, True, 10, 2, 'medium')
+        self.assertTrue(self.file_manager.is_processed(
+            video_path, skip_existing=True, processed_index=index))
+        other_video = Path(self.temp_input_dir) / 'video2.avi'
+        self.assertFalse(self.file_manager.is_processed(
+            other_video, skip_existing=True, processed_index=index))
+    
     def test_mark_processed(self):
         """测试标记文件为已处理"""
         video_path = Path(self.temp_input_dir) / 'video1.mp4'
@@ -183,8 +207,9 @@ class TestFileManager(unittest.TestCase):
         self.file_manager.cleanup_temp_files(keep_recent=2)
         
         # 检查剩余文件数量
-        remaining_files = list(audio_temp_dir.glob('*.wav'))
-        self.assertLessEqual(len(remaining_files), 2)
+        with os.scandir(audio_temp_dir) as entries:
+            remaining = sum(1 for entry in entries if entry.name.endswith('.wav'))
+        self.assertLessEqual(remaining, 2)
 
 
 if __name__ == '__main__':
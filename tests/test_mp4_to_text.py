@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+测试主处理模块
+"""
+
+import unittest
+
+from mp4_to_text import ProcessingStats
+
+
+class TestProcessingStats(unittest.TestCase):
+    """处理统计测试类"""
+    
+    def test_merge(self):
+        """测试合并工作进程返回的统计"""
+        stats = ProcessingStats(total_files=3, processed=1, successful=1,
+                                total_duration=60.0, total_processing_time=6.0, start_time=100.0)
+        delta = ProcessingStats(processed=2, successful=1, failed=1,
+                                total_duration=30.5, total_processing_time=4.5)
+        
+        stats.merge(delta)
+        
+        self.assertEqual(stats.processed, 3)
+        self.assertEqual(stats.successful, 2)
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(stats.skipped, 0)
+        self.assertAlmostEqual(stats.total_duration, 90.5)
+        self.assertAlmostEqual(stats.total_processing_time, 10.5)
+    
+    def test_merge_keeps_run_fields(self):
+        """测试合并不改变文件总数和开始时间"""
+        stats = ProcessingStats(total_files=5, start_time=100.0)
+        stats.merge(ProcessingStats(total_files=1, skipped=1, start_time=200.0))
+        
+        self.assertEqual(stats.total_files, 5)
+        self.assertEqual(stats.start_time, 100.0)
+        self.assertEqual(stats.skipped, 1)
+    
+    def test_merge_empty(self):
+        """测试合并空统计不改变结果"""
+        stats = ProcessingStats(processed=2, successful=2)
+        stats.merge(ProcessingStats())
+        self.assertEqual(stats, ProcessingStats(processed=2, successful=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,21 +5,18 @@
 
 import unittest
 import os
-import sys
 from pathlib import Path
 
-# 添加项目根目录到Python路径
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.platform_utils import PlatformUtils
 
 
 class TestPlatformUtils(unittest.TestCase):
     """平台工具测试类"""
     
-    def setUp(self):
-        """测试前设置"""
-        self.platform_utils = PlatformUtils()
+    @classmethod
+    def setUpClass(cls):
+        """测试前设置（所有测试共用一个实例，测试不会修改它）"""
+        cls.platform_utils = PlatformUtils()
     
     def test_system_detection(self):
         """测试系统检测"""
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+测试转录模块（除模型重建测试外不需要whisper或torch）
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core.transcriber import (
+    SegmentTable,
+    TranscriptionResult,
+    WhisperTranscriber,
+    TORCH_AVAILABLE,
+    WHISPER_AVAILABLE,
+    _drop_repeated_words,
+    _format_timestamp,
+    _import_torch,
+    _import_whisper,
+    _supports_assign,
+)
+
+
+# Whisper风格的分段输出
+WHISPER_SEGMENTS = [
+    {
+        'id': 0, 'seek': 0, 'start': 0.0, 'end': 2.5, 'text': ' Hello world.',
+        'tokens': [50364, 2425, 1002], 'temperature': 0.0, 'avg_logprob': -0.25,
+        'compression_ratio': 1.1, 'no_speech_prob': 0.01,
+        'words': [
+            {'word': ' Hello', 'start': 0.0, 'end': 1.0, 'probability': 0.9},
+            {'word': ' world.', 'start': 1.0, 'end': 2.5, 'probability': 0.8}
+        ]
+    },
+    {
+        'id': 1, 'seek': 250, 'start': 2.5, 'end': 4.0, 'text': ' Bye.',
+        'tokens': [50489, 29463], 'temperature': 0.2, 'avg_logprob': -0.5,
+        'compression_ratio': 0.9, 'no_speech_prob': 0.05,
+        'words': [
+            {'word': ' Bye.', 'start': 2.5, 'end': 4.0, 'probability': 0.7}
+        ]
+    }
+]
+
+
+class TestFormatTimestamp(unittest.TestCase):
+    """时间戳格式化测试类"""
+    
+    def test_whole_seconds(self):
+        """测试无分隔符时只输出整秒"""
+        self.assertEqual(_format_timestamp(0.0), '00:00:00')
+        self.assertEqual(_format_timestamp(3725.4), '01:02:05')
+    
+    def test_milliseconds(self):
+        """测试SRT和WebVTT的毫秒格式"""
+        self.assertEqual(_format_timestamp(61.5, ','), '00:01:01,500')
+        self.assertEqual(_format_timestamp(61.5, '.'), '00:01:01.500')
+    
+    def test_rounding(self):
+        """测试按毫秒四舍五入（不会出现1000毫秒）"""
+        self.assertEqual(_format_timestamp(1.0005, ','), '00:00:01,000')
+        self.assertEqual(_format_timestamp(59.9996, ','), '00:01:00,000')
+        self.assertEqual(_format_timestamp(0.0014, '.'), '00:00:00.001')
+
+
+class TestSegmentTable(unittest.TestCase):
+    """分段表测试类"""
+    
+    def test_columns(self):
+        """测试分段和单词按列存储"""
+        table = SegmentTable.from_segments(WHISPER_SEGMENTS)
+        
+        self.assertEqual(table.num_segments, 2)
+        self.assertEqual(table.num_words, 3)
+        self.assertEqual(table.text, ['Hello world.', 'Bye.'])
+        self.assertEqual(table.start.tolist(), [0.0, 2.5])
+        self.assertEqual(table.end.tolist(), [2.5, 4.0])
+        self.assertEqual(table.word_offsets.tolist(), [0, 2, 3])
+        self.assertEqual(table.word_probs.tolist(), [0.9, 0.8, 0.7])
+    
+    def test_round_trip(self):
+        """测试转换回字典时保留Whisper的全部分段字段"""
+        segments = SegmentTable.from_segments(WHISPER_SEGMENTS).to_dicts()
+        
+        for original, restored in zip(WHISPER_SEGMENTS, segments):
+            expected = dict(original, text=original['text'].strip())
+            self.assertEqual(restored, expected)
+    
+    def test_without_words(self):
+        """测试不收集单词时分段仍然完整"""
+        table = SegmentTable.from_segments(WHISPER_SEGMENTS, include_words=False)
+        self.assertEqual(table.num_words, 0)
+        self.assertEqual(table.word_offsets.tolist(), [0, 0, 0])
+        self.assertEqual([s['words'] for s in table.to_dicts()], [[], []])
+    
+    def test_word_columns_grow(self):
+        """测试单词数超过预估容量时自动扩容"""
+        words = [{'word': f' w{i}', 'start': i, 'end': i + 1, 'probability': 0.5} for i in range(200)]
+        table = SegmentTable.from_segments([{'start': 0.0, 'end': 200.0, 'text': 'x', 'words': words}],
+                                           estimated_words=1)
+        self.assertEqual(table.num_words, 200)
+        self.assertEqual(table.word_starts.tolist(), [float(i) for i in range(200)])
+    
+    def test_empty(self):
+        """测试空结果"""
+        result = TranscriptionResult()
+        self.assertEqual(result.segments.num_segments, 0)
+        self.assertEqual(result.segments.to_dicts(), [])
+        self.assertEqual(result.confidence_scores.size, 0)
+
+
+class TestTranscriberWithoutModel(unittest.TestCase):
+    """转录器测试类（保存结果和参数检查不需要加载模型）"""
+    
+    def setUp(self):
+        """测试前设置"""
+        self._stack = contextlib.ExitStack()
+        self.temp_dir = Path(self._stack.enter_context(tempfile.TemporaryDirectory()))
+        # 跳过__init__：构造函数会检查whisper是否已安装
+        self.transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+        table = SegmentTable.from_segments(WHISPER_SEGMENTS)
+        self.result = TranscriptionResult(text='Hello world. Bye.', segments=table,
+                                          language='en', duration=4.0)
+    
+    def tearDown(self):
+        """测试后清理"""
+        self._stack.close()
+    
+    def test_save_json_keeps_segment_fields(self):
+        """测试JSON输出保留seek、tokens、avg_logprob等字段"""
+        output_path = self.temp_dir / 'result.json'
+        self.transcriber.save_result(self.result, output_path, format_type='json')
+        
+        data = json.loads(output_path.read_text(encoding='utf-8'))
+        self.assertEqual(data['text'], 'Hello world. Bye.')
+        self.assertEqual(data['metadata']['total_segments'], 2)
+        self.assertEqual(data['metadata']['total_words'], 3)
+        for key in ('seek', 'tokens', 'temperature', 'avg_logprob', 'compression_ratio', 'no_speech_prob'):
+            self.assertEqual(data['segments'][1][key], WHISPER_SEGMENTS[1][key])
+    
+    def test_save_srt(self):
+        """测试SRT输出"""
+        output_path = self.temp_dir / 'result.srt'
+        self.transcriber.save_result(self.result, output_path, format_type='srt')
+        
+        self.assertEqual(
+            output_path.read_text(encoding='utf-8'),
+            "1\n00:00:00,000 --> 00:00:02,500\nHello world.\n\n"
+            "2\n00:00:02,500 --> 00:00:04,000\nBye.\n\n"
+        )
+    
+    def test_transcribe_accepts_path_string(self):
+        """测试字符串路径按文件处理（而不是当作音频采样）"""
+        with self.assertRaises(FileNotFoundError):
+            self.transcriber.transcribe(str(self.temp_dir / 'missing.wav'))
+    
+    def test_write_bytes_atomic(self):
+        """测试原子写入：写入后不留下临时文件"""
+        output_path = self.temp_dir / 'out.txt'
+        output_path.write_text('old', encoding='utf-8')
+        
+        self.transcriber._write_text(output_path, '新内容\n')
+        
+        self.assertEqual(output_path.read_bytes(), '新内容\n'.encode('utf-8'))
+        self.assertEqual(os.listdir(self.temp_dir), ['out.txt'])
+    
+    def test_write_bytes_failure_keeps_old_file(self):
+        """测试写入失败时保留原文件并删除临时文件"""
+        output_path = self.temp_dir / 'out.txt'
+        output_path.write_bytes(b'old')
+        
+        with mock.patch('core.transcriber.os.replace', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.transcriber._write_bytes(output_path, b'new')
+        
+        self.assertEqual(output_path.read_bytes(), b'old')
+        self.assertEqual(os.listdir(self.temp_dir), ['out.txt'])
+
+
+class TestTranscriberArguments(unittest.TestCase):
+    """转录器参数检查测试类（检查先于模型依赖检查执行）"""
+    
+    def test_invalid_backend(self):
+        """测试无效推理后端"""
+        with self.assertRaisesRegex(ValueError, 'backend'):
+            WhisperTranscriber('tiny', backend='onnx')
+    
+    def test_invalid_quantize(self):
+        """测试无效量化模式"""
+        with self.assertRaisesRegex(ValueError, 'quantization'):
+            WhisperTranscriber('tiny', quantize='int2')
+    
+    def test_invalid_dtype(self):
+        """测试无效精度"""
+        with self.assertRaisesRegex(ValueError, 'dtype'):
+            WhisperTranscriber('tiny', dtype='int3')
+    
+    def test_invalid_attn_impl(self):
+        """测试无效注意力实现"""
+        with self.assertRaisesRegex(ValueError, 'attention'):
+            WhisperTranscriber('tiny', attn_impl='magic')
+
+
+@unittest.skipUnless(TORCH_AVAILABLE and WHISPER_AVAILABLE, "需要torch和whisper")
+class TestBuildModelFromStateDict(unittest.TestCase):
+    """从state dict重建模型测试类（CPU上的小模型）"""
+    
+    DIMS = {
+        'n_mels': 80, 'n_audio_ctx': 8, 'n_audio_state': 16, 'n_audio_head': 2,
+        'n_audio_layer': 1, 'n_vocab': 64, 'n_text_ctx': 8, 'n_text_state': 16,
+        'n_text_head': 2, 'n_text_layer': 2
+    }
+    
+    def setUp(self):
+        """测试前设置"""
+        self.torch = _import_torch()
+        self.whisper = _import_whisper()
+        if not _supports_assign():
+            self.skipTest("需要torch >= 2.1")
+        self.transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+        self.transcriber.model_name = 'test'
+    
+    def test_round_trip(self):
+        """测试重建的模型直接使用原有张量，且缓冲区与原模型一致"""
+        original = self.whisper.model.Whisper(self.whisper.model.ModelDimensions(**self.DIMS))
+        state_dict = original.state_dict()
+        
+        model = self.transcriber._build_model_from_state_dict(self.DIMS, state_dict)
+        
+        for name, tensor in model.state_dict().items():
+            self.assertFalse(tensor.is_meta, name)
+            self.assertEqual(tensor.data_ptr(), state_dict[name].data_ptr(), name)
+        self.assertTrue(self.torch.equal(model.decoder.mask, original.decoder.mask))
+        self.assertTrue(self.torch.equal(model.alignment_heads.to_dense(),
+                                         original.alignment_heads.to_dense()))
+    
+    def test_missing_weights(self):
+        """测试state dict缺少权重时报错"""
+        original = self.whisper.model.Whisper(self.whisper.model.ModelDimensions(**self.DIMS))
+        state_dict = original.state_dict()
+        del state_dict['decoder.ln.weight']
+        
+        with self.assertRaises(RuntimeError):
+            self.transcriber._build_model_from_state_dict(self.DIMS, state_dict)
+
+
+class TestDropRepeatedWords(unittest.TestCase):
+    """分块边界重复词去除测试类"""
+    
+    def test_overlap_removed(self):
+        """测试去除与上一分块结尾重复的开头"""
+        previous = ['we', 'went', 'to', 'the', 'market']
+        words = ['the', 'market', 'and', 'bought', 'bread']
+        self.assertEqual(_drop_repeated_words(previous, words), ['and', 'bought', 'bread'])
+    
+    def test_punctuation_and_case_ignored(self):
+        """测试比较时忽略标点和大小写"""
+        previous = ['see', 'you', 'Tomorrow.']
+        words = ['tomorrow', 'morning']
+        self.assertEqual(_drop_repeated_words(previous, words), ['morning'])
+    
+    def test_longest_overlap_preferred(self):
+        """测试优先匹配最长的重复"""
+        previous = ['a', 'b', 'a', 'b']
+        words = ['a', 'b', 'a', 'b', 'c']
+        self.assertEqual(_drop_repeated_words(previous, words), ['c'])
+    
+    def test_no_overlap(self):
+        """测试没有重复时保留全部词"""
+        previous = ['hello', 'world']
+        words = ['new', 'sentence']
+        self.assertEqual(_drop_repeated_words(previous, words), words)
+    
+    def test_max_overlap(self):
+        """测试超过max_overlap的重复不会被去除"""
+        previous = ['one', 'two', 'three']
+        words = ['one', 'two', 'three', 'four']
+        self.assertEqual(_drop_repeated_words(previous, words, max_overlap=2), words)
+    
+    def test_empty_inputs(self):
+        """测试空输入"""
+        self.assertEqual(_drop_repeated_words([], ['a']), ['a'])
+        self.assertEqual(_drop_repeated_words(['a'], []), [])
+
+
+if __name__ == '__main__':
+    unittest.main()